@@ -1,29 +1,58 @@
 """Moltbook SDK — Python client for the Moltbook agent social network."""
 
-from importlib.metadata import version as _version
-
-__version__ = _version("moltbook")
-
-from moltbook.client import Moltbook as Moltbook
-from moltbook.client import MoltbookError as MoltbookError
-from moltbook.client import RateLimited as RateLimited
-from moltbook.helpers import summarize_posts as summarize_posts
-from moltbook.helpers import summarize_post as summarize_post
-from moltbook.helpers import summarize_profile as summarize_profile
-from moltbook.helpers import summarize_submolts as summarize_submolts
-from moltbook.helpers import filter_posts as filter_posts
-from moltbook.helpers import extract_comments as extract_comments
-from moltbook.helpers import diff_feed as diff_feed
-from moltbook.helpers import oneline_post as oneline_post
-from moltbook.helpers import oneline_feed as oneline_feed
-from moltbook.helpers import oneline_comment as oneline_comment
-from moltbook.helpers import oneline_comments as oneline_comments
-from moltbook.helpers import oneline_submolt as oneline_submolt
-from moltbook.helpers import oneline_submolts as oneline_submolts
-from moltbook.helpers import relative_age as relative_age
-from moltbook.tracker import ConversationTracker as ConversationTracker
-from moltbook.session import Session as Session
-from moltbook.partners import PartnerMonitor as PartnerMonitor
-from moltbook.filter import FeedFilter as FeedFilter
-from moltbook.rules import FeedRules as FeedRules
-from moltbook.cursor import FeedCursor as FeedCursor
+import importlib
+
+# Public names (and __version__) are resolved on first access (PEP 562) so
+# that importing a single submodule — as the CLI does — doesn't load the
+# whole package.
+_LAZY = {
+    "Moltbook": "moltbook.client",
+    "MoltbookError": "moltbook.client",
+    "RateLimited": "moltbook.client",
+    "summarize_posts": "moltbook.helpers",
+    "summarize_post": "moltbook.helpers",
+    "summarize_profile": "moltbook.helpers",
+    "summarize_submolts": "moltbook.helpers",
+    "filter_posts": "moltbook.helpers",
+    "extract_comments": "moltbook.helpers",
+    "diff_feed": "moltbook.helpers",
+    "oneline_post": "moltbook.helpers",
+    "oneline_feed": "moltbook.helpers",
+    "oneline_comment": "moltbook.helpers",
+    "oneline_comments": "moltbook.helpers",
+    "oneline_submolt": "moltbook.helpers",
+    "oneline_submolts": "moltbook.helpers",
+    "relative_age": "moltbook.helpers",
+    "ConversationTracker": "moltbook.tracker",
+    "Session": "moltbook.session",
+    "PartnerMonitor": "moltbook.partners",
+    "FeedFilter": "moltbook.filter",
+    "FeedRules": "moltbook.rules",
+    "FeedCursor": "moltbook.cursor",
+}
+
+__all__ = ["__version__", *_LAZY]
+
+
+def _load_version():
+    try:
+        from moltbook._version import __version__
+    except ImportError:  # source checkout without a build step
+        return "0+unknown"
+    return __version__
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _load_version()
+    else:
+        module = _LAZY.get(name)
+        if module is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
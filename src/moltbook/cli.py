@@ -5,18 +5,9 @@ import json
 import sys
 
 from moltbook.client import Moltbook, MoltbookError, RateLimited
-from moltbook.helpers import (
-    summarize_posts,
-    summarize_profile,
-    oneline_feed,
-    oneline_submolts,
-)
-from moltbook.session import Session
-from moltbook.tracker import ConversationTracker
-from moltbook.partners import PartnerMonitor
-from moltbook.filter import FeedFilter
-from moltbook.rules import FeedRules
-from moltbook.cursor import FeedCursor
+
+# Everything else is imported inside the command that needs it, so short
+# commands like `molt upvote <id>` only load the API client.
 
 
 USAGE = """\
@@ -71,6 +62,7 @@ Commands:
   verify <code> <answer>           — verify a post/comment
 
 Output is JSON unless noted. 'scan' and 'scan-clean' output text.
+Run 'molt --version' to show the installed version.
 """
 
 
@@ -79,27 +71,30 @@ def main(args=None):
         args = sys.argv[1:]
 
     if not args:
-        print(USAGE)
+        sys.stdout.write(USAGE)
+        return
+
+    if args[0] == "--version":
+        from moltbook import __version__
+
+        sys.stdout.write(f"molt {__version__}\n")
         return
 
     try:
         _run(args)
     except RateLimited as e:
-        json.dump(
+        _write_json(
             {"error": str(e), "retry_after_seconds": e.retry_after_seconds},
             sys.stderr,
         )
-        print(file=sys.stderr)
         sys.exit(1)
     except MoltbookError as e:
-        json.dump({"error": str(e), "code": e.code, "body": e.body}, sys.stderr)
-        print(file=sys.stderr)
+        _write_json({"error": str(e), "code": e.code, "body": e.body}, sys.stderr)
         sys.exit(1)
     except KeyboardInterrupt:
         sys.exit(130)
     except Exception as e:
-        json.dump({"error": str(e)}, sys.stderr)
-        print(file=sys.stderr)
+        _write_json({"error": str(e)}, sys.stderr)
         sys.exit(1)
 
 
@@ -107,376 +102,516 @@ def _run(args):
     cmd = args[0]
     rest = args[1:]
 
-    client = Moltbook()
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        sys.stderr.write(f"Unknown command: {cmd}\n{USAGE}")
+        sys.exit(1)
 
-    if cmd == "feed":
-        sort = rest[0] if len(rest) > 0 else "hot"
-        limit = int(rest[1]) if len(rest) > 1 else 25
-        result = client.feed(sort=sort, limit=limit)
+    # Resolving credentials is skipped for commands that only touch local state
+    client = None if cmd in LOCAL_COMMANDS else Moltbook()
 
-    elif cmd == "scan":
-        sort = rest[0] if len(rest) > 0 else "hot"
-        limit = int(rest[1]) if len(rest) > 1 else 25
-        data = client.feed(sort=sort, limit=limit)
-        print(oneline_feed(data.get("posts", [])))
+    result = handler(client, rest)
+    if result is None:
+        # Text-output commands print their own output
         return
 
-    elif cmd == "brief":
-        tracker = ConversationTracker(client)
-        ff = FeedFilter()
-        fr = FeedRules()
-        cursor = FeedCursor()
-        monitor = PartnerMonitor(client)
-        session = Session(
-            client,
-            tracker,
-            feed_filter=ff,
-            partner_monitor=monitor,
-            feed_rules=fr,
-            feed_cursor=cursor,
-        )
-        result = session.start()
-
-    elif cmd == "post":
-        if not rest:
-            print("Usage: molt post <id>", file=sys.stderr)
-            sys.exit(1)
-        compact = "--compact" in rest
-        post_id = [r for r in rest if r != "--compact"][0]
-        if compact:
-            session = Session(client)
-            result = session.read_post(post_id)
-        else:
-            result = client.post(post_id)
-
-    elif cmd == "posts":
-        if not rest:
-            print("Usage: molt posts <submolt> [sort] [limit]", file=sys.stderr)
-            sys.exit(1)
-        submolt = rest[0]
-        sort = rest[1] if len(rest) > 1 else "hot"
-        limit = int(rest[2]) if len(rest) > 2 else 25
-        result = client.posts(submolt, sort=sort, limit=limit)
-
-    elif cmd == "scan-submolt":
-        if not rest:
-            print("Usage: molt scan-submolt <submolt> [sort] [limit]", file=sys.stderr)
-            sys.exit(1)
-        submolt = rest[0]
-        sort = rest[1] if len(rest) > 1 else "hot"
-        limit = int(rest[2]) if len(rest) > 2 else 25
-        data = client.posts(submolt, sort=sort, limit=limit)
-        print(oneline_feed(data.get("posts", [])))
+    _write_json(result, sys.stdout)
+
+
+def _write_json(obj, stream):
+    """Encode obj as compact JSON in one pass and write it with one call."""
+    _write_bytes((json.dumps(obj, separators=(",", ":")) + "\n").encode(), stream)
+
+
+def _write_raw(body, stream):
+    """Pass an API response body through verbatim, skipping decode/re-encode."""
+    _write_bytes(body.rstrip(b"\n") + b"\n", stream)
+
+
+def _write_bytes(data, stream):
+    """Write UTF-8 bytes to a text stream, bypassing its codec when possible."""
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        # e.g. StringIO in tests, or a stream replaced by the caller
+        stream.write(data.decode())
         return
+    # Keep ordering with anything already written through the text layer
+    stream.flush()
+    buffer.write(data)
+
+
+def _feed_posts(client, rest):
+    """Fetch the feed for `[sort] [limit]` args and keep only its post list.
 
-    elif cmd == "new":
-        if len(rest) < 3:
-            print('Usage: molt new <submolt> "<title>" "<content>"', file=sys.stderr)
-            sys.exit(1)
-        result = client.create_post(rest[0], rest[1], " ".join(rest[2:]))
-
-    elif cmd == "comment":
-        if len(rest) < 2:
-            print("Usage: molt comment <post_id> <content>", file=sys.stderr)
-            sys.exit(1)
-        result = client.comment(rest[0], " ".join(rest[1:]))
-
-    elif cmd == "reply":
-        if len(rest) < 3:
-            print(
-                "Usage: molt reply <post_id> <parent_comment_id> <content>",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-        result = client.comment(rest[0], " ".join(rest[2:]), parent_id=rest[1])
-
-    elif cmd == "upvote":
-        if not rest:
-            print("Usage: molt upvote <post_id>", file=sys.stderr)
-            sys.exit(1)
-        result = client.upvote(rest[0])
-
-    elif cmd == "downvote":
-        if not rest:
-            print("Usage: molt downvote <post_id>", file=sys.stderr)
-            sys.exit(1)
-        result = client.downvote(rest[0])
-
-    elif cmd == "upvote-comment":
-        if not rest:
-            print("Usage: molt upvote-comment <comment_id>", file=sys.stderr)
-            sys.exit(1)
-        result = client.upvote_comment(rest[0])
-
-    elif cmd == "delete":
-        if not rest:
-            print("Usage: molt delete <post_id>", file=sys.stderr)
-            sys.exit(1)
-        result = client.delete_post(rest[0])
-
-    elif cmd == "follow":
-        if not rest:
-            print("Usage: molt follow <agent_name>", file=sys.stderr)
-            sys.exit(1)
-        result = client.follow(rest[0])
-
-    elif cmd == "unfollow":
-        if not rest:
-            print("Usage: molt unfollow <agent_name>", file=sys.stderr)
-            sys.exit(1)
-        result = client.unfollow(rest[0])
-
-    elif cmd == "submolts":
-        compact = "--compact" in rest
-        data = client.submolts()
-        if compact:
-            subs = data.get("submolts", [])
-            print(oneline_submolts(subs))
-            return
-        result = data
-
-    elif cmd == "submolt":
-        if not rest:
-            print("Usage: molt submolt <name>", file=sys.stderr)
-            sys.exit(1)
-        result = client.submolt(rest[0])
-
-    elif cmd == "create-submolt":
-        if len(rest) < 3:
-            print(
-                'Usage: molt create-submolt <name> "<display_name>" "<description>"',
-                file=sys.stderr,
-            )
-            sys.exit(1)
-        result = client.create_submolt(rest[0], rest[1], " ".join(rest[2:]))
-
-    elif cmd == "subscribe":
-        if not rest:
-            print("Usage: molt subscribe <submolt>", file=sys.stderr)
-            sys.exit(1)
-        result = client.subscribe(rest[0])
-
-    elif cmd == "unsubscribe":
-        if not rest:
-            print("Usage: molt unsubscribe <submolt>", file=sys.stderr)
-            sys.exit(1)
-        result = client.unsubscribe(rest[0])
-
-    elif cmd == "search":
-        if not rest:
-            print("Usage: molt search <query>", file=sys.stderr)
-            sys.exit(1)
-        compact = "--compact" in rest
-        query = " ".join(r for r in rest if r != "--compact")
-        data = client.search(query)
-        if compact:
-            posts = data.get("posts", data.get("results", []))
-            if isinstance(posts, list):
-                result = summarize_posts(posts)
-            else:
-                result = data
+    The response envelope is dropped straight away so that, for large
+    limits, only the posts stay alive while they are rendered.
+    """
+    sort = rest[0] if len(rest) > 0 else "hot"
+    limit = int(rest[1]) if len(rest) > 1 else 25
+    return sort, client.feed(sort=sort, limit=limit).get("posts", [])
+
+
+def _require(rest, count, usage):
+    """Exit with a usage message unless at least count arguments were given."""
+    if len(rest) < count:
+        sys.stderr.write(usage + "\n")
+        sys.exit(1)
+
+
+def _split_flags(rest, flag_names):
+    """Partition arguments into (flags, positionals) in a single pass."""
+    flags = set()
+    positional = []
+    for arg in rest:
+        if arg in flag_names:
+            flags.add(arg)
         else:
-            result = data
-
-    elif cmd == "me":
-        compact = "--compact" in rest
-        data = client.me()
-        result = summarize_profile(data) if compact else data
-
-    elif cmd == "profile":
-        if not rest:
-            print("Usage: molt profile <name>", file=sys.stderr)
-            sys.exit(1)
-        compact = "--compact" in rest
-        name = [r for r in rest if r != "--compact"][0]
-        data = client.profile(name)
-        result = summarize_profile(data) if compact else data
-
-    elif cmd == "status":
-        result = client.status()
-
-    elif cmd == "verify":
-        if len(rest) < 2:
-            print("Usage: molt verify <verification_code> <answer>", file=sys.stderr)
-            sys.exit(1)
-        result = client.verify(rest[0], rest[1])
-
-    elif cmd == "watch":
-        if not rest:
-            print("Usage: molt watch <post_id> [comment_id]", file=sys.stderr)
-            sys.exit(1)
-        tracker = ConversationTracker(client)
-        comment_id = rest[1] if len(rest) > 1 else None
-        tracker.watch(rest[0], my_comment_id=comment_id)
-        result = {"watched": rest[0]}
-
-    elif cmd == "replies":
-        tracker = ConversationTracker(client)
-        result = tracker.check_replies()
-
-    elif cmd == "partners":
-        monitor = PartnerMonitor(client)
-        activity = monitor.check()
-        if not activity:
-            print("No new activity from conversation partners.")
-            return
-        for item in activity:
-            print(f"\n{item['partner']}:")
-            print(item["oneline"])
-        return
+            positional.append(arg)
+    return flags, positional
 
-    elif cmd == "partner-add":
-        if not rest:
-            print("Usage: molt partner-add <name>", file=sys.stderr)
-            sys.exit(1)
-        monitor = PartnerMonitor(client)
-        monitor.add(rest[0])
-        result = {"added": rest[0], "partners": monitor.names}
-
-    elif cmd == "partner-rm":
-        if not rest:
-            print("Usage: molt partner-rm <name>", file=sys.stderr)
-            sys.exit(1)
-        monitor = PartnerMonitor(client)
-        monitor.remove(rest[0])
-        result = {"removed": rest[0], "partners": monitor.names}
-
-    elif cmd == "partner-list":
-        monitor = PartnerMonitor(client)
-        print(monitor.summary())
-        return
 
-    elif cmd == "partner-seed":
-        monitor = PartnerMonitor(client)
-        monitor.mark_all_seen()
-        print("Marked all current partner posts as seen.")
-        return
+# State-file backed helpers. Built fresh on every call so callers that drive
+# _run repeatedly (tests, scripts importing the CLI) see the current state
+# files, working directory and client.
 
-    elif cmd == "blocklist":
-        ff = FeedFilter()
-        print(ff.summary())
-        return
 
-    elif cmd == "block":
-        if not rest:
-            print("Usage: molt block <name> [reason]", file=sys.stderr)
-            sys.exit(1)
-        ff = FeedFilter()
-        reason = " ".join(rest[1:]) if len(rest) > 1 else None
-        ff.block(rest[0], reason=reason)
-        result = {"blocked": rest[0], "total": len(ff.blocked)}
-
-    elif cmd == "unblock":
-        if not rest:
-            print("Usage: molt unblock <name>", file=sys.stderr)
-            sys.exit(1)
-        ff = FeedFilter()
-        ff.unblock(rest[0])
-        result = {"unblocked": rest[0], "total": len(ff.blocked)}
-
-    elif cmd == "scan-clean":
-        sort = rest[0] if len(rest) > 0 else "hot"
-        limit = int(rest[1]) if len(rest) > 1 else 25
-        data = client.feed(sort=sort, limit=limit)
-        posts = data.get("posts", [])
-        total = len(posts)
-        ff = FeedFilter()
-        posts = ff.filter_posts(posts)
-        fr = FeedRules()
-        rule_result = fr.apply(posts)
-        posts = rule_result["keep"]
-        removed = total - len(posts)
-        print(oneline_feed(posts))
-        if removed:
-            print(
-                f"\n({removed} posts filtered out by blocklist/rules)",
-                file=sys.stderr,
-            )
-        return
+def _feed_filter():
+    from moltbook.filter import FeedFilter
 
-    elif cmd == "rules":
-        fr = FeedRules()
-        print(fr.summary())
-        return
+    return FeedFilter()
+
+
+def _feed_rules():
+    from moltbook.rules import FeedRules
+
+    return FeedRules()
+
+
+def _feed_cursor():
+    from moltbook.cursor import FeedCursor
+
+    return FeedCursor()
+
+
+def _partner_monitor(client):
+    from moltbook.partners import PartnerMonitor
+
+    return PartnerMonitor(client)
+
+
+# Command handlers. Each takes the client and the remaining arguments and
+# returns a JSON-serializable result, or None if it already printed output.
+
+
+def _cmd_feed(client, rest):
+    sort = rest[0] if len(rest) > 0 else "hot"
+    limit = int(rest[1]) if len(rest) > 1 else 25
+    _write_raw(client.feed_raw(sort=sort, limit=limit), sys.stdout)
+
+
+def _cmd_scan(client, rest):
+    from moltbook.helpers import oneline_feed
+
+    _, posts = _feed_posts(client, rest)
+    print(oneline_feed(posts))
+
+
+def _cmd_brief(client, rest):
+    from moltbook.session import Session
+    from moltbook.tracker import ConversationTracker
+
+    tracker = ConversationTracker(client)
+    ff = _feed_filter()
+    fr = _feed_rules()
+    cursor = _feed_cursor()
+    monitor = _partner_monitor(client)
+    session = Session(
+        client,
+        tracker,
+        feed_filter=ff,
+        partner_monitor=monitor,
+        feed_rules=fr,
+        feed_cursor=cursor,
+    )
+    return session.start()
+
+
+def _cmd_post(client, rest):
+    _require(rest, 1, "Usage: molt post <id>")
+    flags, positional = _split_flags(rest, {"--compact"})
+    compact = "--compact" in flags
+    post_id = positional[0]
+    if compact:
+        from moltbook.session import Session
+
+        session = Session(client)
+        return session.read_post(post_id)
+    return client.post(post_id)
+
+
+def _cmd_posts(client, rest):
+    _require(rest, 1, "Usage: molt posts <submolt> [sort] [limit]")
+    submolt = rest[0]
+    sort = rest[1] if len(rest) > 1 else "hot"
+    limit = int(rest[2]) if len(rest) > 2 else 25
+    _write_raw(client.posts_raw(submolt, sort=sort, limit=limit), sys.stdout)
+
+
+def _cmd_scan_submolt(client, rest):
+    from moltbook.helpers import oneline_feed
+
+    _require(rest, 1, "Usage: molt scan-submolt <submolt> [sort] [limit]")
+    submolt = rest[0]
+    sort = rest[1] if len(rest) > 1 else "hot"
+    limit = int(rest[2]) if len(rest) > 2 else 25
+    data = client.posts(submolt, sort=sort, limit=limit)
+    print(oneline_feed(data.get("posts", [])))
+
+
+def _cmd_new(client, rest):
+    _require(rest, 3, 'Usage: molt new <submolt> "<title>" "<content>"')
+    return client.create_post(rest[0], rest[1], " ".join(rest[2:]))
+
+
+def _cmd_comment(client, rest):
+    _require(rest, 2, "Usage: molt comment <post_id> <content>")
+    return client.comment(rest[0], " ".join(rest[1:]))
+
+
+def _cmd_reply(client, rest):
+    _require(rest, 3, "Usage: molt reply <post_id> <parent_comment_id> <content>")
+    return client.comment(rest[0], " ".join(rest[2:]), parent_id=rest[1])
+
+
+def _cmd_upvote(client, rest):
+    _require(rest, 1, "Usage: molt upvote <post_id>")
+    return client.upvote(rest[0])
 
-    elif cmd == "rule-add":
-        if len(rest) < 3:
-            print(
-                "Usage: molt rule-add <kill|select> <title|author|submolt> <pattern>"
-                " [--submolt name] [--expires days]",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-        action, field, pattern = rest[0], rest[1], rest[2]
-        submolts = None
-        expires_days = None
-        i = 3
-        while i < len(rest):
-            if rest[i] == "--submolt" and i + 1 < len(rest):
-                submolts = submolts or []
-                submolts.append(rest[i + 1])
-                i += 2
-            elif rest[i] == "--expires" and i + 1 < len(rest):
-                expires_days = int(rest[i + 1])
-                i += 2
-            else:
-                i += 1
-        fr = FeedRules()
-        fr.add(action, field, pattern, submolts=submolts, expires_days=expires_days)
-        result = {
-            "added": {"action": action, "field": field, "pattern": pattern},
-            "total": len(fr.rules),
-        }
-
-    elif cmd == "rule-rm":
-        if not rest:
-            print("Usage: molt rule-rm <index>", file=sys.stderr)
-            sys.exit(1)
-        fr = FeedRules()
-        fr.remove(int(rest[0]))
-        result = {"removed": int(rest[0]), "total": len(fr.rules)}
-
-    elif cmd == "catch-up":
-        cursor = FeedCursor()
-        hot = client.feed(sort="hot", limit=25).get("posts", [])
-        new = client.feed(sort="new", limit=25).get("posts", [])
-        cursor.catch_up(source="hot", posts=hot)
-        cursor.catch_up(source="new", posts=new)
-        print(f"Marked {len(hot)} hot + {len(new)} new posts as seen.")
-        return
 
-    elif cmd == "unseen":
-        sort = rest[0] if len(rest) > 0 else "hot"
-        limit = int(rest[1]) if len(rest) > 1 else 25
-        data = client.feed(sort=sort, limit=limit)
-        posts = data.get("posts", [])
-        total = len(posts)
-        ff = FeedFilter()
-        posts = ff.filter_posts(posts)
-        fr = FeedRules()
-        posts = fr.apply(posts)["keep"]
-        cursor = FeedCursor()
-        unseen = cursor.unseen(posts, source=sort)
-        filtered = total - len(posts)
-        seen = len(posts) - len(unseen)
-        print(oneline_feed(unseen))
-        parts = []
-        if filtered:
-            parts.append(f"{filtered} filtered")
-        if seen:
-            parts.append(f"{seen} previously seen")
-        if parts:
-            print(f"\n({', '.join(parts)})", file=sys.stderr)
-        cursor.mark_seen(posts, source=sort)
+def _cmd_downvote(client, rest):
+    _require(rest, 1, "Usage: molt downvote <post_id>")
+    return client.downvote(rest[0])
+
+
+def _cmd_upvote_comment(client, rest):
+    _require(rest, 1, "Usage: molt upvote-comment <comment_id>")
+    return client.upvote_comment(rest[0])
+
+
+def _cmd_delete(client, rest):
+    _require(rest, 1, "Usage: molt delete <post_id>")
+    return client.delete_post(rest[0])
+
+
+def _cmd_follow(client, rest):
+    _require(rest, 1, "Usage: molt follow <agent_name>")
+    return client.follow(rest[0])
+
+
+def _cmd_unfollow(client, rest):
+    _require(rest, 1, "Usage: molt unfollow <agent_name>")
+    return client.unfollow(rest[0])
+
+
+def _cmd_submolts(client, rest):
+    from moltbook.helpers import oneline_submolts
+
+    flags, _ = _split_flags(rest, {"--compact"})
+    if "--compact" not in flags:
+        _write_raw(client.submolts_raw(), sys.stdout)
         return
+    subs = client.submolts().get("submolts", [])
+    print(oneline_submolts(subs))
+
+
+def _cmd_submolt(client, rest):
+    _require(rest, 1, "Usage: molt submolt <name>")
+    return client.submolt(rest[0])
+
+
+def _cmd_create_submolt(client, rest):
+    _require(
+        rest,
+        3,
+        'Usage: molt create-submolt <name> "<display_name>" "<description>"',
+    )
+    return client.create_submolt(rest[0], rest[1], " ".join(rest[2:]))
+
+
+def _cmd_subscribe(client, rest):
+    _require(rest, 1, "Usage: molt subscribe <submolt>")
+    return client.subscribe(rest[0])
+
+
+def _cmd_unsubscribe(client, rest):
+    _require(rest, 1, "Usage: molt unsubscribe <submolt>")
+    return client.unsubscribe(rest[0])
+
+
+def _cmd_search(client, rest):
+    from moltbook.helpers import summarize_posts
+
+    _require(rest, 1, "Usage: molt search <query>")
+    flags, positional = _split_flags(rest, {"--compact"})
+    query = " ".join(positional)
+    if "--compact" not in flags:
+        _write_raw(client.search_raw(query), sys.stdout)
+        return None
+    data = client.search(query)
+    posts = data.get("posts", data.get("results", []))
+    if isinstance(posts, list):
+        return summarize_posts(posts)
+    return data
+
+
+def _cmd_me(client, rest):
+    from moltbook.helpers import summarize_profile
+
+    flags, _ = _split_flags(rest, {"--compact"})
+    data = client.me()
+    return summarize_profile(data) if "--compact" in flags else data
+
+
+def _cmd_profile(client, rest):
+    from moltbook.helpers import summarize_profile
+
+    _require(rest, 1, "Usage: molt profile <name>")
+    flags, positional = _split_flags(rest, {"--compact"})
+    data = client.profile(positional[0])
+    return summarize_profile(data) if "--compact" in flags else data
+
+
+def _cmd_status(client, rest):
+    return client.status()
 
-    else:
-        print(f"Unknown command: {cmd}", file=sys.stderr)
-        print(USAGE, file=sys.stderr)
-        sys.exit(1)
 
-    json.dump(result, sys.stdout, separators=(",", ":"))
-    print()
+def _cmd_verify(client, rest):
+    _require(rest, 2, "Usage: molt verify <verification_code> <answer>")
+    return client.verify(rest[0], rest[1])
+
+
+def _cmd_watch(client, rest):
+    from moltbook.tracker import ConversationTracker
+
+    _require(rest, 1, "Usage: molt watch <post_id> [comment_id]")
+    tracker = ConversationTracker(client)
+    comment_id = rest[1] if len(rest) > 1 else None
+    tracker.watch(rest[0], my_comment_id=comment_id)
+    return {"watched": rest[0]}
+
+
+def _cmd_replies(client, rest):
+    from moltbook.tracker import ConversationTracker
+
+    tracker = ConversationTracker(client)
+    return tracker.check_replies()
+
+
+def _cmd_partners(client, rest):
+    monitor = _partner_monitor(client)
+    activity = monitor.check()
+    if not activity:
+        print("No new activity from conversation partners.")
+        return None
+    sys.stdout.write(
+        "".join(f"\n{item['partner']}:\n{item['oneline']}\n" for item in activity)
+    )
+    return None
+
+
+def _cmd_partner_add(client, rest):
+    _require(rest, 1, "Usage: molt partner-add <name>")
+    monitor = _partner_monitor(client)
+    monitor.add(rest[0])
+    return {"added": rest[0], "partners": monitor.names}
+
+
+def _cmd_partner_rm(client, rest):
+    _require(rest, 1, "Usage: molt partner-rm <name>")
+    monitor = _partner_monitor(client)
+    monitor.remove(rest[0])
+    return {"removed": rest[0], "partners": monitor.names}
+
+
+def _cmd_partner_list(client, rest):
+    monitor = _partner_monitor(client)
+    print(monitor.summary())
+
+
+def _cmd_partner_seed(client, rest):
+    monitor = _partner_monitor(client)
+    monitor.mark_all_seen()
+    print("Marked all current partner posts as seen.")
+
+
+def _cmd_blocklist(client, rest):
+    ff = _feed_filter()
+    print(ff.summary())
+
+
+def _cmd_block(client, rest):
+    _require(rest, 1, "Usage: molt block <name> [reason]")
+    ff = _feed_filter()
+    reason = " ".join(rest[1:]) if len(rest) > 1 else None
+    ff.block(rest[0], reason=reason)
+    return {"blocked": rest[0], "total": len(ff.blocked)}
+
+
+def _cmd_unblock(client, rest):
+    _require(rest, 1, "Usage: molt unblock <name>")
+    ff = _feed_filter()
+    ff.unblock(rest[0])
+    return {"unblocked": rest[0], "total": len(ff.blocked)}
+
+
+def _cmd_scan_clean(client, rest):
+    from moltbook.helpers import oneline_feed
+
+    sort, posts = _feed_posts(client, rest)
+    total = len(posts)
+    ff = _feed_filter()
+    posts = ff.filter_posts(posts)
+    fr = _feed_rules()
+    rule_result = fr.apply(posts)
+    posts = rule_result["keep"]
+    removed = total - len(posts)
+    print(oneline_feed(posts))
+    if removed:
+        sys.stderr.write(f"\n({removed} posts filtered out by blocklist/rules)\n")
+
+
+def _cmd_rules(client, rest):
+    fr = _feed_rules()
+    print(fr.summary())
+
+
+def _cmd_rule_add(client, rest):
+    _require(
+        rest,
+        3,
+        "Usage: molt rule-add <kill|select> <title|author|submolt> <pattern>"
+        " [--submolt name] [--expires days]",
+    )
+    action, field, pattern = rest[0], rest[1], rest[2]
+    submolts = None
+    expires_days = None
+    i = 3
+    while i < len(rest):
+        if rest[i] == "--submolt" and i + 1 < len(rest):
+            submolts = submolts or []
+            submolts.append(rest[i + 1])
+            i += 2
+        elif rest[i] == "--expires" and i + 1 < len(rest):
+            expires_days = int(rest[i + 1])
+            i += 2
+        else:
+            i += 1
+    fr = _feed_rules()
+    fr.add(action, field, pattern, submolts=submolts, expires_days=expires_days)
+    return {
+        "added": {"action": action, "field": field, "pattern": pattern},
+        "total": len(fr.rules),
+    }
+
+
+def _cmd_rule_rm(client, rest):
+    _require(rest, 1, "Usage: molt rule-rm <index>")
+    fr = _feed_rules()
+    fr.remove(int(rest[0]))
+    return {"removed": int(rest[0]), "total": len(fr.rules)}
+
+
+def _cmd_catch_up(client, rest):
+    cursor = _feed_cursor()
+    hot = client.feed(sort="hot", limit=25).get("posts", [])
+    new = client.feed(sort="new", limit=25).get("posts", [])
+    cursor.catch_up(source="hot", posts=hot)
+    cursor.catch_up(source="new", posts=new)
+    print(f"Marked {len(hot)} hot + {len(new)} new posts as seen.")
+
+
+def _cmd_unseen(client, rest):
+    from moltbook.helpers import oneline_feed
+
+    sort, posts = _feed_posts(client, rest)
+    total = len(posts)
+    ff = _feed_filter()
+    posts = ff.filter_posts(posts)
+    fr = _feed_rules()
+    posts = fr.apply(posts)["keep"]
+    cursor = _feed_cursor()
+    unseen = cursor.consume(posts, source=sort)
+    filtered = total - len(posts)
+    seen = len(posts) - len(unseen)
+    print(oneline_feed(unseen))
+    parts = []
+    if filtered:
+        parts.append(f"{filtered} filtered")
+    if seen:
+        parts.append(f"{seen} previously seen")
+    if parts:
+        sys.stderr.write(f"\n({', '.join(parts)})\n")
+
+
+COMMANDS = {
+    "feed": _cmd_feed,
+    "scan": _cmd_scan,
+    "brief": _cmd_brief,
+    "post": _cmd_post,
+    "posts": _cmd_posts,
+    "scan-submolt": _cmd_scan_submolt,
+    "new": _cmd_new,
+    "comment": _cmd_comment,
+    "reply": _cmd_reply,
+    "upvote": _cmd_upvote,
+    "downvote": _cmd_downvote,
+    "upvote-comment": _cmd_upvote_comment,
+    "delete": _cmd_delete,
+    "follow": _cmd_follow,
+    "unfollow": _cmd_unfollow,
+    "submolts": _cmd_submolts,
+    "submolt": _cmd_submolt,
+    "create-submolt": _cmd_create_submolt,
+    "subscribe": _cmd_subscribe,
+    "unsubscribe": _cmd_unsubscribe,
+    "search": _cmd_search,
+    "me": _cmd_me,
+    "profile": _cmd_profile,
+    "status": _cmd_status,
+    "verify": _cmd_verify,
+    "watch": _cmd_watch,
+    "replies": _cmd_replies,
+    "partners": _cmd_partners,
+    "partner-add": _cmd_partner_add,
+    "partner-rm": _cmd_partner_rm,
+    "partner-list": _cmd_partner_list,
+    "partner-seed": _cmd_partner_seed,
+    "blocklist": _cmd_blocklist,
+    "block": _cmd_block,
+    "unblock": _cmd_unblock,
+    "scan-clean": _cmd_scan_clean,
+    "rules": _cmd_rules,
+    "rule-add": _cmd_rule_add,
+    "rule-rm": _cmd_rule_rm,
+    "catch-up": _cmd_catch_up,
+    "unseen": _cmd_unseen,
+}
+
+
+# Commands that only read or write local state files and never call the API
+LOCAL_COMMANDS = frozenset(
+    {
+        "partner-add",
+        "partner-rm",
+        "partner-list",
+        "blocklist",
+        "block",
+        "unblock",
+        "rules",
+        "rule-add",
+        "rule-rm",
+    }
+)
 
 
 if __name__ == "__main__":
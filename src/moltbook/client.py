@@ -1,17 +1,48 @@
 # ABOUTME: API client for Moltbook, the agent social network.
 # ABOUTME: Handles authentication, request building, and JSON parsing for all endpoints.
 
+import base64
+import concurrent.futures
+import email.utils
+import functools
+import http.client
 import json
 import os
+import random
+import sys
+import threading
 import time
-import urllib.request
 import urllib.parse
-import urllib.error
+import urllib.request
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
 
 MAX_RETRIES = 3
-RETRY_DELAY = 10
+MAX_WORKERS = 8
+# Exponential backoff: BASE_DELAY * 2**attempt, capped at MAX_DELAY, then
+# stretched by up to JITTER so clients don't retry in lockstep.
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+JITTER = 0.5
 RETRYABLE_CODES = {429, 500, 502, 503, 504}
+# A 429 whose Retry-After exceeds this raises RateLimited instead of sleeping
+MAX_RETRY_AFTER = 120
+# Seconds to reuse read-mostly responses (submolts, profiles, me, status);
+# override with MOLTBOOK_CACHE_TTL, 0 disables.
+CACHE_TTL = 60.0
+
+# Raised when the server closed an idle kept-alive connection
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+# Safe to send again if a stale connection fails after the request went out
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+# Redirects are followed the way urllib.request.urlopen follows them
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 10
 
 
 class MoltbookError(Exception):
@@ -35,12 +66,78 @@ class RateLimited(MoltbookError):
         self.args = (f"Rate limited. Try again in {minutes} minute(s).",)
 
 
-def _parse_error_body(http_error):
-    """Try to parse JSON from an HTTPError response body."""
+def _backoff(attempt):
+    """Delay in seconds before retry number attempt + 1."""
+    return min(MAX_DELAY, BASE_DELAY * 2**attempt) * (1 + random.random() * JITTER)
+
+
+def _parse_retry_after(value):
+    """Seconds to wait from a Retry-After header, or None if absent/invalid.
+
+    Accepts both delay-seconds and HTTP-date forms.
+    """
+    if value is None:
+        return None
+    value = value.strip()
     try:
-        return json.loads(http_error.read())
-    except (json.JSONDecodeError, OSError):
+        return max(0.0, float(int(value)))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_error_body(payload):
+    """Try to parse JSON from an error response body."""
+    try:
+        body = json.loads(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _open_connection(scheme, netloc):
+    """Open a connection to scheme://netloc, via the environment's proxy if any.
+
+    Honours HTTPS_PROXY/HTTP_PROXY/NO_PROXY like urllib does. Returns
+    (connection, target prefix, extra headers): requests through a plain
+    HTTP proxy name the absolute URL, HTTPS is tunnelled with CONNECT.
+    """
+    host = urllib.parse.urlsplit("//" + netloc).hostname or netloc
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=30), "", {}
+        return http.client.HTTPConnection(netloc, timeout=30), "", {}
+
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    parts = urllib.parse.urlsplit(proxy)
+    proxy_headers = {}
+    if parts.username is not None:
+        userpass = urllib.parse.unquote(parts.username) + ":"
+        userpass += urllib.parse.unquote(parts.password or "")
+        token = base64.b64encode(userpass.encode()).decode()
+        proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+    proxy_netloc = parts.netloc.rpartition("@")[2]
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(proxy_netloc, timeout=30)
+        conn.set_tunnel(netloc, headers=proxy_headers)
+        return conn, "", {}
+    conn = http.client.HTTPConnection(proxy_netloc, timeout=30)
+    return conn, f"{scheme}://{netloc}", proxy_headers
+
+
+def _cache_ttl():
+    try:
+        return float(os.environ.get("MOLTBOOK_CACHE_TTL", CACHE_TTL))
+    except ValueError:
+        return CACHE_TTL
 
 
 def _resolve_api_key(credentials_path=None):
@@ -55,10 +152,23 @@ def _resolve_api_key(credentials_path=None):
     env_key = os.environ.get("MOLTBOOK_API_KEY")
     if env_key:
         return env_key
+    if credentials_path is not None:
+        credentials_path = str(credentials_path)
+    return _read_api_key(credentials_path, str(Path.home()), str(Path.cwd()))
+
 
+@functools.lru_cache(maxsize=8)
+def _read_api_key(credentials_path, home, cwd):
+    """Read the API key from the credential files.
+
+    Cached per (path, home, cwd) so repeated clients skip the file reads;
+    a failed lookup raises and is not cached. A key rotated in the files
+    is not seen by later clients in the same process until
+    _read_api_key.cache_clear() is called; MOLTBOOK_API_KEY always is.
+    """
     candidates = [
-        Path.home() / ".config" / "moltbook" / "credentials.json",
-        Path.cwd() / "credentials.json",
+        Path(home) / ".config" / "moltbook" / "credentials.json",
+        Path(cwd) / "credentials.json",
     ]
     if credentials_path is not None:
         candidates.append(Path(credentials_path))
@@ -91,84 +201,292 @@ class Moltbook:
 
     def __init__(self, credentials_path=None):
         self.api_key = _resolve_api_key(credentials_path)
+        # Kept-alive connections per thread, keyed by (scheme, netloc);
+        # http.client connections are not safe to share between threads.
+        self._local = threading.local()
+        # Every open connection, so close() can reach other threads' too
+        self._open_conns = weakref.WeakSet()
+        self._open_conns_lock = threading.Lock()
+        self._header_cache = None
+        self.cache_ttl = _cache_ttl()
+        self._cache = {}
+        # url -> (ETag, body) for conditional GETs of polled endpoints
+        self._etags = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connection(self, scheme, netloc):
+        """This thread's connection entry for an origin, opened on first use.
+
+        An entry is [connection, target prefix, extra headers, reused].
+        """
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        entry = conns.get((scheme, netloc))
+        if entry is None:
+            conn, prefix, headers = _open_connection(scheme, netloc)
+            entry = conns[(scheme, netloc)] = [conn, prefix, headers, False]
+            with self._open_conns_lock:
+                self._open_conns.add(conn)
+        return entry
+
+    def _drop_connection(self, scheme, netloc):
+        entry = getattr(self._local, "conns", {}).pop((scheme, netloc), None)
+        if entry is not None:
+            entry[0].close()
+
+    def close(self):
+        """Close the kept-alive connections of every thread.
+
+        Call once the client's requests are done (or use the client as a
+        context manager). A later request opens a new connection.
+        """
+        with self._open_conns_lock:
+            conns = list(self._open_conns)
+            self._open_conns.clear()
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
+    def _send(self, method, url, data, headers=None):
+        """Send one request for url over a kept-alive connection.
+
+        Returns (status, headers, body), after following any redirects.
+        headers, if given, are sent in addition to the default ones.
+        """
+        request_headers = self._headers()
+        if headers:
+            request_headers = {**request_headers, **headers}
+        for _ in range(MAX_REDIRECTS):
+            status, resp_headers, payload = self._send_once(
+                method, url, data, request_headers
+            )
+            location = resp_headers.get("Location")
+            if status not in _REDIRECT_CODES or not location:
+                break
+            if method not in ("GET", "HEAD"):
+                if method != "POST" or status in (307, 308):
+                    break
+                method, data = "GET", None
+            url = urllib.parse.urljoin(url, location)
+        return status, resp_headers, payload
+
+    def _send_once(self, method, url, data, headers):
+        """Send a request without following redirects.
+
+        If the server dropped an idle reused connection, it is reopened and
+        the request sent once more. Non-idempotent requests are only resent
+        when the failure came before the request was fully written.
+        """
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        while True:
+            entry = self._connection(parts.scheme, parts.netloc)
+            conn, prefix, proxy_headers, reused = entry
+            if proxy_headers:
+                headers = {**headers, **proxy_headers}
+            sent = False
+            try:
+                conn.request(method, prefix + target, body=data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                payload = resp.read()
+            except _STALE_CONNECTION_ERRORS:
+                self._drop_connection(parts.scheme, parts.netloc)
+                if reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    continue
+                raise
+            except Exception:
+                self._drop_connection(parts.scheme, parts.netloc)
+                raise
+            entry[3] = True
+            return resp.status, resp.headers, payload
 
     def _headers(self):
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        """Request headers, built once per API key. Do not mutate."""
+        cached = self._header_cache
+        if cached is None or cached[0] != self.api_key:
+            cached = self._header_cache = (
+                self.api_key,
+                {
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return cached[1]
+
+    def _request(self, method, path, params=None, body=None, conditional=False):
+        return json.loads(
+            self._request_raw(
+                method, path, params=params, body=body, conditional=conditional
+            )
+        )
+
+    def _cached_get(self, path):
+        """GET path, reusing a response younger than cache_ttl.
 
-    def _request(self, method, path, params=None, body=None):
-        url = self.base_url + path
+        Cached results are shared between callers; treat them as read-only.
+        """
+        now = time.monotonic()
+        hit = self._cache.get(path)
+        if hit is not None and now - hit[0] < self.cache_ttl:
+            return hit[1]
+        result = self._request("GET", path)
+        if self.cache_ttl > 0:
+            self._cache[path] = (now, result)
+        return result
+
+    def cache_clear(self):
+        """Drop all cached responses."""
+        self._cache.clear()
+
+    def _request_raw(self, method, path, params=None, body=None, conditional=False):
+        """Perform a request and return the response body bytes undecoded.
+
+        With conditional=True the last ETag seen for the URL is sent as
+        If-None-Match, and a 304 reply returns the body stored with it.
+        """
+        query = ""
         if params:
-            url += "?" + urllib.parse.urlencode(params)
+            query = "?" + urllib.parse.urlencode(params)
+        url = self.base_url + path + query
 
         data = None
         if body is not None:
             data = json.dumps(body).encode()
+        if method != "GET":
+            # Any write may change a cached profile or submolt
+            self._cache.clear()
+
+        extra_headers = None
+        cached = self._etags.get(url) if conditional else None
+        if cached is not None:
+            extra_headers = {"If-None-Match": cached[0]}
 
-        req = urllib.request.Request(
-            url, data=data, headers=self._headers(), method=method
-        )
         last_error = None
+        last_code = 0
         for attempt in range(MAX_RETRIES):
             try:
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    return json.loads(resp.read())
-            except urllib.error.HTTPError as e:
-                error_body = _parse_error_body(e)
-
-                if e.code == 429:
-                    retry_minutes = error_body.get("retry_after_minutes")
-                    if retry_minutes is not None:
-                        raise RateLimited(
-                            int(retry_minutes) * 60, url, error_body
-                        ) from e
-
-                if e.code not in RETRYABLE_CODES:
-                    raise MoltbookError(e.code, url, error_body) from e
-
+                status, headers, payload = self._send(
+                    method, url, data, extra_headers
+                )
+            except (OSError, http.client.HTTPException) as e:
                 last_error = e
+                last_code = 0
                 if attempt < MAX_RETRIES - 1:
-                    retry_after = int(e.headers.get("Retry-After", RETRY_DELAY))
-                    import sys as _sys
-
+                    delay = _backoff(attempt)
                     print(
-                        f"HTTP {e.code}. Retrying in {retry_after}s "
-                        f"(attempt {attempt + 1}/{MAX_RETRIES})...",
-                        file=_sys.stderr,
+                        f"Connection error: {e}. Retrying in "
+                        f"{delay:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})...",
+                        file=sys.stderr,
                     )
-                    time.sleep(retry_after)
-                    continue
-            except urllib.error.URLError as e:
-                last_error = e
-                if attempt < MAX_RETRIES - 1:
-                    import sys as _sys
-
-                    print(
-                        f"Connection error: {e.reason}. Retrying in "
-                        f"{RETRY_DELAY}s (attempt {attempt + 1}/{MAX_RETRIES})...",
-                        file=_sys.stderr,
-                    )
-                    time.sleep(RETRY_DELAY)
-                    continue
+                    time.sleep(delay)
+                continue
+
+            if 200 <= status < 300:
+                if conditional:
+                    etag = headers.get("ETag")
+                    if etag:
+                        self._etags[url] = (etag, payload)
+                return payload
+            if status == 304 and cached is not None:
+                return cached[1]
+
+            error_body = _parse_error_body(payload)
+
+            retry_after = _parse_retry_after(headers.get("Retry-After"))
+            if status == 429:
+                retry_minutes = error_body.get("retry_after_minutes")
+                if retry_minutes is not None:
+                    raise RateLimited(int(retry_minutes) * 60, url, error_body)
+                if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                    raise RateLimited(int(retry_after), url, error_body)
+
+            if status not in RETRYABLE_CODES:
+                raise MoltbookError(status, url, error_body)
+
+            last_error = f"HTTP {status}"
+            last_code = status
+            if attempt < MAX_RETRIES - 1:
+                delay = _backoff(attempt)
+                if retry_after is not None:
+                    delay = max(retry_after, delay)
+                print(
+                    f"HTTP {status}. Retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{MAX_RETRIES})...",
+                    file=sys.stderr,
+                )
+                time.sleep(delay)
 
         raise MoltbookError(
-            getattr(last_error, "code", 0),
+            last_code,
             url,
             {"error": f"Failed after {MAX_RETRIES} attempts: {last_error}"},
         )
 
+    def gather(self, calls, max_workers=MAX_WORKERS):
+        """Run independent zero-argument calls concurrently.
+
+        Returns results in the order of calls. Each worker thread keeps its
+        own connection; the first exception raised by a call propagates.
+
+        Usage::
+
+            profiles = client.gather(
+                [lambda n=n: client.profile(n) for n in names]
+            )
+        """
+        calls = list(calls)
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        workers = min(max_workers, len(calls))
+        with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
     # Feed & posts
 
     def feed(self, sort="hot", limit=25):
-        return self._request("GET", "/feed", params={"sort": sort, "limit": limit})
+        return self._request(
+            "GET", "/feed", params={"sort": sort, "limit": limit}, conditional=True
+        )
+
+    def feed_raw(self, sort="hot", limit=25):
+        """Like feed(), but return the undecoded JSON response bytes."""
+        return self._request_raw(
+            "GET", "/feed", params={"sort": sort, "limit": limit}, conditional=True
+        )
 
     def posts(self, submolt, sort="hot", limit=25, offset=0):
         return self._request(
             "GET",
             f"/submolts/{submolt}/posts",
             params={"sort": sort, "limit": limit, "offset": offset},
+            conditional=True,
+        )
+
+    def posts_raw(self, submolt, sort="hot", limit=25, offset=0):
+        """Like posts(), but return the undecoded JSON response bytes."""
+        return self._request_raw(
+            "GET",
+            f"/submolts/{submolt}/posts",
+            params={"sort": sort, "limit": limit, "offset": offset},
+            conditional=True,
+        )
+
+    def posts_many(self, submolts, sort="hot", limit=25):
+        """Fetch posts for several submolts concurrently, in the given order."""
+        return self.gather(
+            [
+                lambda s=s: self.posts(s, sort=sort, limit=limit)
+                for s in submolts
+            ]
         )
 
     def post(self, post_id):
@@ -215,11 +533,15 @@ class Moltbook:
     # Submolts
 
     def submolts(self):
-        return self._request("GET", "/submolts")
+        return self._cached_get("/submolts")
+
+    def submolts_raw(self):
+        """Like submolts(), but return the undecoded JSON response bytes."""
+        return self._request_raw("GET", "/submolts")
 
     def submolt(self, name):
         """Get details for a single submolt."""
-        return self._request("GET", f"/submolts/{name}")
+        return self._cached_get(f"/submolts/{name}")
 
     def create_submolt(self, name, display_name, description):
         return self._request(
@@ -243,16 +565,20 @@ class Moltbook:
     def search(self, query):
         return self._request("GET", "/search", params={"q": query})
 
+    def search_raw(self, query):
+        """Like search(), but return the undecoded JSON response bytes."""
+        return self._request_raw("GET", "/search", params={"q": query})
+
     # Profile
 
     def me(self):
-        return self._request("GET", "/me")
+        return self._cached_get("/me")
 
     def profile(self, name):
-        return self._request("GET", f"/agents/{name}")
+        return self._cached_get(f"/agents/{name}")
 
     def status(self):
-        return self._request("GET", "/claim/status")
+        return self._cached_get("/claim/status")
 
     def update_profile(self, description):
         return self._request("PUT", "/me", body={"description": description})
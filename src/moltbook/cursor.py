@@ -22,6 +22,11 @@ class FeedCursor:
         cursor = FeedCursor()
         new_posts = cursor.unseen(posts, source="hot")
         cursor.mark_seen(posts, source="hot")
+
+        # Batch many updates into a single write
+        with cursor:
+            for post in posts:
+                cursor.mark_seen([post], source="hot")
     """
 
     def __init__(self, cursor_path=None):
@@ -29,9 +34,35 @@ class FeedCursor:
             cursor_path = resolve_state_path("cursor.json")
         self.cursor_path = cursor_path
         self._data = load_json(cursor_path, default=lambda: {"sources": {}})
+        # Per-source set mirroring seen_ids for O(1) lookups; built lazily
+        # and kept in step with the list, which stays the on-disk format.
+        self._seen_sets = {}
+        # Inside a `with cursor:` block saves are deferred until exit
+        self._batch_depth = 0
+        self._dirty = False
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
 
     def _save(self):
-        save_json(self.cursor_path, self._data)
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            save_json(self.cursor_path, self._data, compact=True)
+            self._dirty = False
+
+    def flush(self):
+        """Write any changes deferred by a batch."""
+        if self._dirty:
+            save_json(self.cursor_path, self._data, compact=True)
+            self._dirty = False
 
     def _source(self, name):
         """Get or create a source entry."""
@@ -40,6 +71,13 @@ class FeedCursor:
             sources[name] = {"seen_ids": [], "last_checked": None}
         return sources[name]
 
+    def _seen_set(self, name):
+        """The set of seen IDs for a source."""
+        seen = self._seen_sets.get(name)
+        if seen is None:
+            seen = self._seen_sets[name] = set(self._source(name)["seen_ids"])
+        return seen
+
     def mark_seen(self, posts, source=None):
         """Record post IDs as seen.
 
@@ -47,21 +85,25 @@ class FeedCursor:
             posts: list of post dicts (must have "id" key)
             source: feed source name ("hot", "new", submolt name)
         """
-        source = source or "default"
+        self._record_seen(posts, source or "default")
+        self._save()
+
+    def _record_seen(self, posts, source):
+        """Add post IDs to a source's seen list in memory (no save)."""
         src = self._source(source)
         existing = src["seen_ids"]
-        seen_set = set(existing)
+        seen_set = self._seen_set(source)
         for p in posts:
             pid = p.get("id") if isinstance(p, dict) else p
             if pid and pid not in seen_set:
                 existing.append(pid)
                 seen_set.add(pid)
         # Cap: trim oldest entries from the front
-        if len(existing) > _MAX_SEEN_PER_SOURCE:
-            existing = existing[-_MAX_SEEN_PER_SOURCE:]
-        src["seen_ids"] = existing
+        overflow = len(existing) - _MAX_SEEN_PER_SOURCE
+        if overflow > 0:
+            seen_set.difference_update(existing[:overflow])
+            del existing[:overflow]
         src["last_checked"] = datetime.now(timezone.utc).isoformat()
-        self._save()
 
     def unseen(self, posts, source=None):
         """Filter to only posts not yet seen.
@@ -73,11 +115,28 @@ class FeedCursor:
         Returns:
             list of posts whose IDs are not in the seen set
         """
-        source = source or "default"
-        src = self._source(source)
-        seen = set(src["seen_ids"])
+        seen = self._seen_set(source or "default")
         return [p for p in posts if p.get("id") not in seen]
 
+    def consume(self, posts, source=None):
+        """Return the unseen posts and mark all of them seen in one step.
+
+        Equivalent to unseen() followed by mark_seen(), but the state
+        file is written once.
+
+        Args:
+            posts: list of post dicts
+            source: feed source name
+
+        Returns:
+            list of posts whose IDs were not in the seen set
+        """
+        source = source or "default"
+        fresh = self.unseen(posts, source=source)
+        self._record_seen(posts, source)
+        self._save()
+        return fresh
+
     def catch_up(self, source=None, posts=None):
         """Mark everything as seen (nn's -a0 equivalent).
 
@@ -88,7 +147,7 @@ class FeedCursor:
                    Without posts, only the timestamp is updated.
         """
         if posts:
-            self.mark_seen(posts, source=source or "default")
+            self._record_seen(posts, source or "default")
         now = datetime.now(timezone.utc).isoformat()
         if source:
             src = self._source(source)
@@ -108,8 +167,10 @@ class FeedCursor:
             sources = self._data.get("sources", {})
             if source in sources:
                 sources[source] = {"seen_ids": [], "last_checked": None}
+            self._seen_sets.pop(source, None)
         else:
             self._data["sources"] = {}
+            self._seen_sets.clear()
         self._save()
 
     def stats(self):
@@ -1,7 +1,13 @@
 # ABOUTME: Feed filter and spam blocklist for Moltbook agents.
 # ABOUTME: Strips known spam actors from feeds and comment trees before display.
 
-from moltbook.helpers import _author_name, resolve_state_path, load_json, save_json
+from moltbook.helpers import (
+    _author_name,
+    _prune_comments,
+    resolve_state_path,
+    load_json,
+    save_json,
+)
 
 
 class FeedFilter:
@@ -39,6 +45,8 @@ class FeedFilter:
         self._data = load_json(
             blocklist_path, default=lambda: {"blocked": [], "reasons": {}}
         )
+        # Membership set kept in step with the "blocked" list by block/unblock
+        self._blocked_set = set(self._data.get("blocked", []))
 
     def _save(self):
         save_json(self.blocklist_path, self._data)
@@ -46,7 +54,7 @@ class FeedFilter:
     @property
     def blocked(self):
         """Set of blocked author names (case-sensitive)."""
-        return set(self._data.get("blocked", []))
+        return set(self._blocked_set)
 
     def block(self, name, reason=None):
         """Add an author to the blocklist."""
@@ -54,6 +62,7 @@ class FeedFilter:
         if name not in blocked:
             blocked.append(name)
             self._data["blocked"] = blocked
+        self._blocked_set.add(name)
         if reason:
             reasons = self._data.get("reasons", {})
             reasons[name] = reason
@@ -64,6 +73,7 @@ class FeedFilter:
         """Remove an author from the blocklist."""
         blocked = self._data.get("blocked", [])
         self._data["blocked"] = [n for n in blocked if n != name]
+        self._blocked_set.discard(name)
         reasons = self._data.get("reasons", {})
         reasons.pop(name, None)
         self._data["reasons"] = reasons
@@ -71,32 +81,29 @@ class FeedFilter:
 
     def is_blocked(self, author):
         """Check if an author name (string or dict) is blocked."""
-        return _author_name(author) in self.blocked
+        return _author_name(author) in self._blocked_set
 
     def filter_posts(self, posts):
         """Remove posts by blocked authors. Returns a new list."""
-        return [p for p in posts if _author_name(p.get("author")) not in self.blocked]
+        blocked = self._blocked_set
+        if not blocked:
+            return list(posts)
+        return [p for p in posts if _author_name(p.get("author")) not in blocked]
 
     def filter_comments(self, comments):
         """Remove comments by blocked authors from a comment tree.
 
-        Recursively filters the nested replies structure. If a blocked
+        Filters the nested replies structure at any depth. If a blocked
         author's comment has non-blocked replies, the replies are
-        promoted up (not lost with their parent).
+        promoted up (not lost with their parent). Comments whose subtree
+        is unchanged are returned as-is; changed ones are copied.
         """
-        result = []
-        for c in comments:
-            replies = c.get("replies", [])
-            filtered_replies = self.filter_comments(replies) if replies else []
-
-            if _author_name(c.get("author")) in self.blocked:
-                # Blocked author: drop the comment, promote any clean replies
-                result.extend(filtered_replies)
-            else:
-                if filtered_replies != replies:
-                    c = dict(c, replies=filtered_replies)
-                result.append(c)
-        return result
+        if not self._blocked_set:
+            return list(comments)
+        blocked = self._blocked_set
+        return _prune_comments(
+            comments, lambda c: _author_name(c.get("author")) in blocked
+        )
 
     def filter_post_data(self, post_data):
         """Filter comments within a full post response.
@@ -104,7 +111,7 @@ class FeedFilter:
         Accepts the raw API response from client.post(id) and returns
         it with blocked comments removed.
         """
-        if not isinstance(post_data, dict):
+        if not isinstance(post_data, dict) or not self._blocked_set:
             return post_data
         comments = post_data.get("comments", [])
         if comments:
@@ -1,21 +1,35 @@
 # ABOUTME: Helper functions for working with Moltbook API responses.
 # ABOUTME: Reduces token cost by summarizing and filtering post data.
 
+import functools
 import json
+import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
 
+# These run for every post in every filter and render. Exact type checks
+# for the plain dict/str that json produces come first; isinstance still
+# covers dict subclasses.
+
+
 def _author_name(author):
     """Extract author name from a string or dict."""
-    if isinstance(author, dict):
+    cls = type(author)
+    if cls is dict:
+        return author.get("name", "unknown")
+    if cls is not str and isinstance(author, dict):
         return author.get("name", "unknown")
     return author or "unknown"
 
 
 def _submolt_name(submolt):
     """Extract submolt name from a string or dict."""
-    if isinstance(submolt, dict):
+    cls = type(submolt)
+    if cls is dict:
+        return submolt.get("name", "")
+    if cls is not str and isinstance(submolt, dict):
         return submolt.get("name", "")
     return submolt or ""
 
@@ -50,18 +64,38 @@ def resolve_state_path(filename):
 def load_json(path, default=None):
     """Load a JSON file, returning default on missing/corrupt file."""
     try:
-        return json.loads(Path(path).read_text())
-    except (FileNotFoundError, json.JSONDecodeError):
+        return json.loads(Path(path).read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
         return (
             default() if callable(default) else (default if default is not None else {})
         )
 
 
-def save_json(path, data):
-    """Save data as indented JSON, creating parent directories."""
+def save_json(path, data, compact=False):
+    """Save data as indented JSON, creating parent directories.
+
+    compact=True drops whitespace, for machine-owned state that can grow
+    large. Writes a sibling temp file and renames it over path, so a crash
+    mid-write leaves the previous state intact rather than a truncated file.
+    The temp name is unique per thread, and an existing file keeps its mode.
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2))
+    if compact:
+        payload = json.dumps(data, separators=(",", ":")).encode()
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(payload)
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def summarize_post(post):
@@ -70,14 +104,15 @@ def summarize_post(post):
     Returns a compact dict with id, title, author, submolt, upvotes,
     comment_count, and created_at. Drops content, URL, and nested objects.
     """
+    get = post.get
     return {
-        "id": post.get("id"),
-        "title": post.get("title", ""),
-        "author": _author_name(post.get("author")),
-        "submolt": _submolt_name(post.get("submolt")),
-        "upvotes": post.get("upvotes", 0),
-        "comment_count": post.get("comment_count", 0),
-        "created_at": post.get("created_at", ""),
+        "id": get("id"),
+        "title": get("title", ""),
+        "author": _author_name(get("author")),
+        "submolt": _submolt_name(get("submolt")),
+        "upvotes": get("upvotes", 0),
+        "comment_count": get("comment_count", 0),
+        "created_at": get("created_at", ""),
     }
 
 
@@ -97,31 +132,34 @@ def filter_posts(posts, min_upvotes=None, authors=None, submolts=None):
 
     Returns filtered list (does not mutate input).
     """
-    result = posts
-    if min_upvotes is not None:
-        result = [p for p in result if p.get("upvotes", 0) >= min_upvotes]
-    if authors is not None:
-        author_set = set(authors)
-        result = [p for p in result if _author_name(p.get("author")) in author_set]
-    if submolts is not None:
-        submolt_set = set(submolts)
-        result = [p for p in result if _submolt_name(p.get("submolt")) in submolt_set]
-    return result
-
-
-def oneline_post(post):
+    if min_upvotes is None and authors is None and submolts is None:
+        return posts
+    author_set = set(authors) if authors is not None else None
+    submolt_set = set(submolts) if submolts is not None else None
+    return [
+        p
+        for p in posts
+        if (min_upvotes is None or p.get("upvotes", 0) >= min_upvotes)
+        and (author_set is None or _author_name(p.get("author")) in author_set)
+        and (submolt_set is None or _submolt_name(p.get("submolt")) in submolt_set)
+    ]
+
+
+def oneline_post(post, now=None):
     """Ultra-compact single-line representation of a post.
 
     Format: "[+5|3c] Title (by Author in submolt) #id"
     Optimized for minimum token count during feed triage.
+    now is passed to relative_age.
     """
-    upvotes = post.get("upvotes", 0)
-    comments = post.get("comment_count", 0)
-    title = post.get("title", "")
-    author = _author_name(post.get("author"))
-    submolt = _submolt_name(post.get("submolt"))
-    post_id = post.get("id", "?")
-    age = relative_age(post.get("created_at", ""))
+    get = post.get
+    upvotes = get("upvotes", 0)
+    comments = get("comment_count", 0)
+    title = get("title", "")
+    author = _author_name(get("author"))
+    submolt = _submolt_name(get("submolt"))
+    post_id = get("id", "?")
+    age = relative_age(get("created_at", ""), now)
     sub = f" in {submolt}" if submolt else ""
     return f"[{upvotes:+d}|{comments}c|{age}] {title} (by {author}{sub}) #{post_id}"
 
@@ -133,7 +171,8 @@ def oneline_feed(posts):
     scan a feed — an agent can read 25 posts in ~25 lines instead of
     a massive JSON blob.
     """
-    return "\n".join(oneline_post(p) for p in posts)
+    now = datetime.now(timezone.utc)
+    return "\n".join([oneline_post(p, now) for p in posts])
 
 
 def oneline_comment(comment):
@@ -141,12 +180,13 @@ def oneline_comment(comment):
 
     Format: "[+2] Author: content (truncated) #id"
     """
-    upvotes = comment.get("upvotes", 0)
-    author = _author_name(comment.get("author"))
-    content = comment.get("content", "")
+    get = comment.get
+    upvotes = get("upvotes", 0)
+    author = _author_name(get("author"))
+    content = get("content", "")
     if len(content) > 120:
         content = content[:117] + "..."
-    comment_id = comment.get("id", "?")
+    comment_id = get("id", "?")
     return f"[{upvotes:+d}] {author}: {content} #{comment_id}"
 
 
@@ -162,6 +202,10 @@ def diff_feed(old_posts, new_posts):
 
     Returns list of posts that are new (not in old_posts by ID).
     """
+    if not new_posts:
+        return []
+    if not old_posts:
+        return list(new_posts)
     old_ids = {p.get("id") for p in old_posts}
     return [p for p in new_posts if p.get("id") not in old_ids]
 
@@ -172,22 +216,30 @@ def oneline_comments(comments):
     Like oneline_feed but for comments. Accepts the output of
     extract_comments(flat=True) or any list of comment dicts.
     """
-    return "\n".join(oneline_comment(c) for c in comments)
+    return "\n".join([oneline_comment(c) for c in comments])
 
 
-def relative_age(timestamp):
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp):
+    """Parse an ISO 8601 timestamp, cached: feeds repeat the same posts."""
+    # Handle both Z suffix and +00:00
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def relative_age(timestamp, now=None):
     """Convert an ISO 8601 timestamp to a compact relative age string.
 
     Returns strings like '2h', '3d', '1w', '2mo'. Falls back to the
     original string if parsing fails. Much cheaper than full timestamps.
+    Pass now (an aware UTC datetime) to share one clock reading across
+    a batch.
     """
     if not timestamp:
         return "?"
     try:
-        # Handle both Z suffix and +00:00
-        ts = timestamp.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(ts)
-        now = datetime.now(timezone.utc)
+        dt = _parse_timestamp(timestamp)
+        if now is None:
+            now = datetime.now(timezone.utc)
         delta = now - dt
         seconds = int(delta.total_seconds())
         if seconds < 0:
@@ -243,9 +295,10 @@ def oneline_submolt(submolt):
 
     Format: \"m/name (123 subs) Description\"
     """
-    name = submolt.get("name", "")
-    subs = submolt.get("subscriber_count", 0)
-    desc = submolt.get("description", "")
+    get = submolt.get
+    name = get("name", "")
+    subs = get("subscriber_count", 0)
+    desc = get("description", "")
     if len(desc) > 60:
         desc = desc[:57] + "..."
     return f"m/{name} ({subs} subs) {desc}"
@@ -253,7 +306,7 @@ def oneline_submolt(submolt):
 
 def oneline_submolts(submolts):
     """Render a submolt list as one line per submolt."""
-    return "\n".join(oneline_submolt(s) for s in submolts)
+    return "\n".join([oneline_submolt(s) for s in submolts])
 
 
 def summarize_profile(profile):
@@ -289,6 +342,61 @@ def summarize_profile(profile):
     return result
 
 
+def _comment_entry(c):
+    get = c.get
+    return {
+        "id": get("id"),
+        "author": _author_name(get("author")),
+        "content": get("content", ""),
+        "upvotes": get("upvotes", 0),
+        "parent_id": get("parent_id"),
+        "created_at": get("created_at", ""),
+    }
+
+
+_END = object()
+
+
+def _prune_comments(comments, drop):
+    """Remove comments for which drop(comment) is true from a comment tree.
+
+    Replies of a dropped comment are promoted into its place. Comments
+    whose subtree is unchanged are returned as-is; only ancestors of a
+    removed comment are copied. Walks the tree with an explicit stack so
+    deep threads don't hit the recursion limit.
+    """
+    result = out = []
+    changed = False
+    it = iter(comments)
+    # Each frame: (comment whose replies are being walked, its siblings
+    # iterator, the output list and changed flag of its level)
+    stack = []
+    while True:
+        c = next(it, _END)
+        if c is _END:
+            if not stack:
+                return result
+            replies_out, replies_changed = out, changed
+            c, it, out, changed = stack.pop()
+        else:
+            replies = c.get("replies")
+            if replies:
+                stack.append((c, it, out, changed))
+                it, out, changed = iter(replies), [], False
+                continue
+            replies_out, replies_changed = [], False
+
+        if drop(c):
+            # Drop the comment, promote any surviving replies
+            out.extend(replies_out)
+            changed = True
+        else:
+            if replies_changed:
+                c = dict(c, replies=replies_out)
+                changed = True
+            out.append(c)
+
+
 def extract_comments(comments, flat=False):
     """Extract comment data from a nested comment tree.
 
@@ -296,23 +404,25 @@ def extract_comments(comments, flat=False):
     Each comment gets an 'author' field normalized to a string name.
     """
     result = []
-    for c in comments:
-        entry = {
-            "id": c.get("id"),
-            "author": _author_name(c.get("author")),
-            "content": c.get("content", ""),
-            "upvotes": c.get("upvotes", 0),
-            "parent_id": c.get("parent_id"),
-            "created_at": c.get("created_at", ""),
-        }
-        if flat:
-            result.append(entry)
-            replies = c.get("replies", [])
+    if flat:
+        stack = list(reversed(comments))
+        while stack:
+            c = stack.pop()
+            result.append(_comment_entry(c))
+            replies = c.get("replies")
             if replies:
-                result.extend(extract_comments(replies, flat=True))
-        else:
-            replies = c.get("replies", [])
+                stack.extend(reversed(replies))
+        return result
+
+    # Each item: (comments at one level, list their entries go into)
+    stack = [(comments, result)]
+    while stack:
+        level, out = stack.pop()
+        for c in level:
+            entry = _comment_entry(c)
+            replies = c.get("replies")
             if replies:
-                entry["replies"] = extract_comments(replies, flat=False)
-            result.append(entry)
+                entry["replies"] = []
+                stack.append((replies, entry["replies"]))
+            out.append(entry)
     return result
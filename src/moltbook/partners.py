@@ -1,9 +1,11 @@
 # ABOUTME: Conversation partner monitor for Moltbook agents.
 # ABOUTME: Tracks agents you care about and surfaces their new posts/comments.
 
+import concurrent.futures
+
 from moltbook.helpers import (
     _author_name,
-    oneline_post,
+    oneline_feed,
     summarize_post,
     resolve_state_path,
     load_json,
@@ -11,6 +13,14 @@ from moltbook.helpers import (
 )
 
 
+def _posts_by_author(posts):
+    """Index a post list by normalized author name, keeping feed order."""
+    index = {}
+    for p in posts:
+        index.setdefault(_author_name(p.get("author")), []).append(p)
+    return index
+
+
 class PartnerMonitor:
     """Monitors conversation partners for new activity.
 
@@ -30,6 +40,9 @@ class PartnerMonitor:
         monitor.add("bicep")
         monitor.add("Marth")
         new_activity = monitor.check()
+
+    Feeds are fetched on a small long-lived thread pool; close() the
+    monitor (or use it as a context manager) when done.
     """
 
     def __init__(self, client, state_path=None):
@@ -38,9 +51,50 @@ class PartnerMonitor:
             state_path = resolve_state_path("partners.json")
         self.state_path = state_path
         self._state = load_json(state_path, default=lambda: {"partners": {}})
+        # Per-partner set mirroring seen_post_ids for O(1) lookups; built
+        # lazily and kept in step with the list, which stays the file format.
+        self._seen_sets = {}
+        # Kept between checks so its threads reuse their client connections
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the feed-fetching thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
 
     def _save(self):
-        save_json(self.state_path, self._state)
+        save_json(self.state_path, self._state, compact=True)
+
+    def _seen_set(self, name):
+        """The set of seen post IDs for a partner."""
+        seen = self._seen_sets.get(name)
+        if seen is None:
+            entry = self._state["partners"][name]
+            seen = self._seen_sets[name] = set(entry.get("seen_post_ids", []))
+        return seen
+
+    def _record_seen(self, name, post_ids):
+        """Append unseen IDs to a partner's seen list (no save).
+
+        Returns True if any ID was new.
+        """
+        entry = self._state["partners"][name]
+        seen = self._seen_set(name)
+        ids = entry.setdefault("seen_post_ids", [])
+        added = False
+        for pid in post_ids:
+            if pid not in seen:
+                seen.add(pid)
+                ids.append(pid)
+                added = True
+        return added
 
     @property
     def names(self):
@@ -56,12 +110,30 @@ class PartnerMonitor:
     def remove(self, name):
         """Stop monitoring a conversation partner."""
         self._state["partners"].pop(name, None)
+        self._seen_sets.pop(name, None)
         self._save()
 
     def _find_posts_by_author(self, author_name, posts):
         """Filter a post list down to posts by a specific author."""
         return [p for p in posts if _author_name(p.get("author")) == author_name]
 
+    def _fetch_feeds(self):
+        """Fetch the hot and new feeds concurrently; hot posts come first.
+
+        A feed that fails to load contributes no posts.
+        """
+
+        def fetch(sort):
+            try:
+                return self.client.feed(sort=sort, limit=25).get("posts", [])
+            except Exception:
+                return []
+
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(2)
+        hot, new = self._pool.map(fetch, ("hot", "new"))
+        return hot + new
+
     def _search_partner(self, name):
         """Search for a partner's posts via the search API."""
         try:
@@ -103,30 +175,22 @@ class PartnerMonitor:
             ]
 
         Only includes partners with new (unseen) activity.
-        Updates seen state and saves automatically.
+        Updates seen state and saves automatically when it changed.
         """
         # Fetch feeds if not provided
         if feed_posts is None:
-            feed_posts = []
-            try:
-                hot = self.client.feed(sort="hot", limit=25)
-                feed_posts.extend(hot.get("posts", []))
-            except Exception:
-                pass
-            try:
-                new = self.client.feed(sort="new", limit=25)
-                feed_posts.extend(new.get("posts", []))
-            except Exception:
-                pass
+            feed_posts = self._fetch_feeds()
 
         results = []
+        changed = False
+        feed_by_author = _posts_by_author(feed_posts)
 
-        for name, entry in self._state["partners"].items():
-            seen_ids = set(entry.get("seen_post_ids", []))
+        for name in self._state["partners"]:
+            seen_ids = self._seen_set(name)
             found_posts = {}
 
             # Primary: check the feed we already have
-            for p in self._find_posts_by_author(name, feed_posts):
+            for p in feed_by_author.get(name, ()):
                 pid = p.get("id")
                 if pid:
                     found_posts[pid] = p
@@ -143,7 +207,7 @@ class PartnerMonitor:
 
             if new_posts:
                 summarized = [summarize_post(p) for p in new_posts]
-                onelines = "\n".join(oneline_post(p) for p in new_posts)
+                onelines = oneline_feed(new_posts)
                 results.append(
                     {
                         "partner": name,
@@ -153,10 +217,10 @@ class PartnerMonitor:
                 )
 
             # Update seen state with everything we found
-            all_found_ids = list(seen_ids | set(found_posts.keys()))
-            entry["seen_post_ids"] = all_found_ids
+            changed |= self._record_seen(name, found_posts)
 
-        self._save()
+        if changed:
+            self._save()
         return results
 
     def mark_all_seen(self, name=None):
@@ -168,17 +232,7 @@ class PartnerMonitor:
         "new" posts on first run.
         """
         # Fetch feeds once for all partners
-        feed_posts = []
-        try:
-            hot = self.client.feed(sort="hot", limit=25)
-            feed_posts.extend(hot.get("posts", []))
-        except Exception:
-            pass
-        try:
-            new = self.client.feed(sort="new", limit=25)
-            feed_posts.extend(new.get("posts", []))
-        except Exception:
-            pass
+        feed_posts = self._fetch_feeds()
 
         partners = (
             {name: self._state["partners"][name]}
@@ -186,15 +240,15 @@ class PartnerMonitor:
             else self._state["partners"]
         )
 
-        for pname, entry in partners.items():
-            found_ids = set(entry.get("seen_post_ids", []))
-            for p in self._find_posts_by_author(pname, feed_posts):
-                pid = p.get("id")
-                if pid:
-                    found_ids.add(pid)
-            entry["seen_post_ids"] = list(found_ids)
+        feed_by_author = _posts_by_author(feed_posts)
+        changed = False
+        for pname in partners:
+            changed |= self._record_seen(
+                pname, [p["id"] for p in feed_by_author.get(pname, ()) if p.get("id")]
+            )
 
-        self._save()
+        if changed:
+            self._save()
 
     def summary(self):
         """Return a compact text summary of monitored partners.
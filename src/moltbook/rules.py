@@ -1,11 +1,13 @@
 # ABOUTME: Pattern-based feed rules for Moltbook agents (kill/select).
 # ABOUTME: Inspired by nn's kill file — auto-hide or auto-highlight posts by pattern.
 
+import functools
 import re
 from datetime import datetime, timezone, timedelta
 
 from moltbook.helpers import (
     _author_name,
+    _prune_comments,
     _submolt_name,
     resolve_state_path,
     load_json,
@@ -13,25 +15,141 @@ from moltbook.helpers import (
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _compile(regex):
+    """Compile a rule regex once per process. Returns None if invalid."""
+    try:
+        return re.compile(regex, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _never(text):
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _matcher(pattern):
+    """Build a text -> bool matcher for a rule pattern, once per pattern.
+
+    /regex/ patterns search case-insensitively; anything else is a
+    case-insensitive substring test against a pre-lowercased needle.
+    """
+    if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2:
+        compiled = _compile(pattern[1:-1])
+        if compiled is None:
+            return _never
+        search = compiled.search
+        return lambda text: search(text) is not None
+    needle = pattern.lower()
+    return lambda text: needle in text.lower()
+
+
+def _any_matcher(patterns):
+    matchers = [_matcher(p) for p in patterns]
+    return lambda text: any(m(text) for m in matchers)
+
+
+# Inline flags, named groups and conditionals don't survive being spliced
+# into a larger alternation; patterns using them are matched one by one.
+_NOT_UNIONABLE = re.compile(r"\(\?[^:=!<]")
+
+
+@functools.lru_cache(maxsize=64)
+def _union_matcher(patterns):
+    """One matcher for a tuple of patterns that scans the text once.
+
+    Substrings and regexes are joined into a single case-insensitive
+    alternation run against the lowercased text, so R rules on a field
+    cost one regex search instead of R matcher calls.
+    """
+    if len(patterns) == 1:
+        return _matcher(patterns[0])
+    parts = []
+    for pattern in patterns:
+        if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2:
+            compiled = _compile(pattern[1:-1])
+            if compiled is None:
+                continue  # invalid regex never matches
+            if compiled.groups or _NOT_UNIONABLE.search(compiled.pattern):
+                return _any_matcher(patterns)
+            parts.append(f"(?:{compiled.pattern})")
+        else:
+            parts.append(re.escape(pattern.lower()))
+    if not parts:
+        return _never
+    try:
+        search = re.compile("|".join(parts), re.IGNORECASE).search
+    except re.error:
+        return _any_matcher(patterns)
+    return lambda text: search(text.lower()) is not None
+
+
+_FIELD_COST = {"submolt": 0, "author": 1, "title": 2}
+
+
+def _rules_matcher(rules):
+    """Predicate over _post_fields() that is true if any rule matches.
+
+    Unscoped rules are merged into one union matcher per field; rules
+    scoped to submolts are checked individually.
+    """
+    patterns_by_field = {}
+    scoped = []
+    for rule in rules:
+        if rule.get("submolts"):
+            scoped.append(rule)
+        else:
+            patterns_by_field.setdefault(rule["field"], []).append(rule["pattern"])
+    # Short fields first: a hit there skips searching the longer title
+    checks = [
+        (field, _union_matcher(tuple(patterns_by_field[field])))
+        for field in sorted(patterns_by_field, key=lambda f: _FIELD_COST.get(f, 3))
+    ]
+
+    def matches(fields):
+        for field, matcher in checks:
+            text = fields[field]
+            if text and matcher(text):
+                return True
+        for rule in scoped:
+            if fields["submolt"] in rule["submolts"] and _match(
+                rule["pattern"], fields[rule["field"]]
+            ):
+                return True
+        return False
+
+    return matches
+
+
 def _match(pattern, text):
     """Match a pattern against text. /regex/ for regex, else substring."""
     if not text:
         return False
-    if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2:
-        try:
-            return bool(re.search(pattern[1:-1], text, re.IGNORECASE))
-        except re.error:
-            return False
-    return pattern.lower() in text.lower()
+    return _matcher(pattern)(text)
+
+
+class _PostFields(dict):
+    """Rule fields of a post; any other field is read from the post as-is."""
+
+    def __init__(self, post):
+        super().__init__(
+            title=post.get("title", ""),
+            author=_author_name(post.get("author")),
+            submolt=_submolt_name(post.get("submolt")),
+        )
+        self.post = post
 
+    def __missing__(self, field):
+        return self.post.get(field, "")
 
-def _get_field(post, field):
-    """Extract a field value from a post dict."""
-    if field == "author":
-        return _author_name(post.get("author"))
-    if field == "submolt":
-        return _submolt_name(post.get("submolt"))
-    return post.get(field, "")
+
+def _post_fields(post):
+    """All rule fields of a post, normalised once for matching many rules."""
+    return _PostFields(post)
+
+
+_NEVER = datetime.max.replace(tzinfo=timezone.utc)
 
 
 class FeedRules:
@@ -55,6 +173,9 @@ class FeedRules:
             rules_path = resolve_state_path("rules.json")
         self.rules_path = rules_path
         self._data = load_json(rules_path, default=lambda: {"rules": []})
+        # Earliest expiry among the rules; prune() has nothing to do before
+        # it. None means unknown (not scanned yet, or rules were added).
+        self._next_expiry = None
 
     def _save(self):
         save_json(self.rules_path, self._data)
@@ -96,6 +217,7 @@ class FeedRules:
         rules = self._data.get("rules", [])
         rules.append(rule)
         self._data["rules"] = rules
+        self._next_expiry = None
         self._save()
 
     def remove(self, rule_id):
@@ -107,10 +229,17 @@ class FeedRules:
             self._save()
 
     def prune(self):
-        """Remove expired rules."""
+        """Remove expired rules.
+
+        Cheap to call repeatedly: the rules are only rescanned once the
+        earliest expiry seen by the last scan has passed.
+        """
         now = datetime.now(timezone.utc)
+        if self._next_expiry is not None and now < self._next_expiry:
+            return
         rules = self._data.get("rules", [])
         kept = []
+        next_expiry = _NEVER
         for r in rules:
             expires = r.get("expires")
             if expires:
@@ -118,22 +247,15 @@ class FeedRules:
                     exp_dt = datetime.fromisoformat(expires)
                     if exp_dt <= now:
                         continue
+                    next_expiry = min(next_expiry, exp_dt)
                 except (ValueError, TypeError):
                     pass
             kept.append(r)
+        self._next_expiry = next_expiry
         if len(kept) != len(rules):
             self._data["rules"] = kept
             self._save()
 
-    def _rule_matches(self, rule, post):
-        """Check if a single rule matches a post."""
-        submolts = rule.get("submolts")
-        if submolts:
-            post_submolt = _get_field(post, "submolt")
-            if post_submolt not in submolts:
-                return False
-        return _match(rule["pattern"], _get_field(post, rule["field"]))
-
     def apply(self, posts):
         """Apply all rules to a list of posts.
 
@@ -145,19 +267,16 @@ class FeedRules:
         self.prune()
         rules = self._data.get("rules", [])
         keep, killed, selected = [], [], []
+        if not rules:
+            return {"keep": list(posts), "killed": killed, "selected": selected}
 
+        is_killed = _rules_matcher([r for r in rules if r["action"] == "kill"])
+        is_selected = _rules_matcher([r for r in rules if r["action"] == "select"])
         for post in posts:
-            post_killed = False
-            post_selected = False
-            for rule in rules:
-                if self._rule_matches(rule, post):
-                    if rule["action"] == "kill":
-                        post_killed = True
-                    elif rule["action"] == "select":
-                        post_selected = True
-            if post_killed:
+            fields = _post_fields(post)
+            if is_killed(fields):
                 killed.append(post)
-            elif post_selected:
+            elif is_selected(fields):
                 selected.append(post)
                 keep.append(post)
             else:
@@ -175,23 +294,8 @@ class FeedRules:
         kill_rules = [r for r in self._data.get("rules", []) if r["action"] == "kill"]
         if not kill_rules:
             return comments
-        return self._filter_comment_tree(comments, kill_rules)
-
-    def _filter_comment_tree(self, comments, kill_rules):
-        result = []
-        for c in comments:
-            replies = c.get("replies", [])
-            filtered_replies = (
-                self._filter_comment_tree(replies, kill_rules) if replies else []
-            )
-            killed = any(self._rule_matches(r, c) for r in kill_rules)
-            if killed:
-                result.extend(filtered_replies)
-            else:
-                if filtered_replies != replies:
-                    c = dict(c, replies=filtered_replies)
-                result.append(c)
-        return result
+        is_killed = _rules_matcher(kill_rules)
+        return _prune_comments(comments, lambda c: is_killed(_post_fields(c)))
 
     def summary(self):
         """Compact text summary of active rules."""
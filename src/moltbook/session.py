@@ -1,7 +1,18 @@
 # ABOUTME: Session helper for Moltbook agents.
 # ABOUTME: One-call session briefing that reduces boilerplate and token waste.
 
-from moltbook.helpers import _author_name, summarize_posts, extract_comments
+import concurrent.futures
+import time
+
+from moltbook.helpers import (
+    _author_name,
+    extract_comments,
+    summarize_posts,
+)
+
+# Seconds a fetched feed is reused by repeat start()/catch_up() calls
+FEED_CACHE_TTL = 30.0
+MAX_WORKERS = 8
 
 
 class Session:
@@ -20,6 +31,10 @@ class Session:
         tracker = ConversationTracker(client)
         session = Session(client, tracker)
         brief = session.start()
+
+    A session keeps a thread pool whose workers hold kept-alive client
+    connections; close() it (or use the session as a context manager)
+    when done.
     """
 
     def __init__(
@@ -37,23 +52,70 @@ class Session:
         self.partner_monitor = partner_monitor
         self.feed_rules = feed_rules
         self.feed_cursor = feed_cursor
+        self._feed_cache = {}
+        # post_id -> (time, Future of client.post()), from start(prefetch=...)
+        self._prefetched = {}
+        # Shared by start(), catch_up() and prefetching; long-lived so its
+        # threads keep reusing their client connections
+        self._pool = None
+        # Our agent name, looked up once per session
+        self._agent_name = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Cancel pending prefetches and shut down the session's thread pool."""
+        self._prefetched.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
 
-    def start(self, feed_limit=25):
+    def _executor(self):
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(MAX_WORKERS)
+        return self._pool
+
+    def _feed(self, sort, limit):
+        """Fetch a feed, reusing a response younger than FEED_CACHE_TTL."""
+        now = time.monotonic()
+        hit = self._feed_cache.get((sort, limit))
+        if hit is not None and now - hit[0] < FEED_CACHE_TTL:
+            return hit[1]
+        result = self.client.feed(sort=sort, limit=limit)
+        self._feed_cache[(sort, limit)] = (now, result)
+        return result
+
+    def start(self, feed_limit=25, prefetch=0):
         """Fetch a structured session briefing.
 
+        With prefetch=N, the first N unseen posts are fetched in the
+        background so a following read_post() of one of them doesn't wait
+        on the network. Off by default since it spends API requests.
+
         Returns a dict with:
             feed_hot: summarized hot posts (filtered if FeedFilter provided)
             feed_new: summarized new posts (filtered if FeedFilter provided)
             replies: new replies from tracker (if tracker provided)
             partner_activity: new posts from partners (if monitor provided)
             filtered_count: number of posts removed by blocklist
+
+        Every list holds its own summary dicts; they are safe to annotate.
         """
         brief = {}
 
-        hot_raw = self.client.feed(sort="hot", limit=feed_limit)
-        hot_posts = hot_raw.get("posts", [])
-        new_raw = self.client.feed(sort="new", limit=feed_limit)
-        new_posts = new_raw.get("posts", [])
+        # Both feeds and the reply check are independent network calls
+        pool = self._executor()
+        hot_future = pool.submit(self._feed, "hot", feed_limit)
+        new_future = pool.submit(self._feed, "new", feed_limit)
+        replies_future = (
+            pool.submit(self.tracker.check_replies) if self.tracker else None
+        )
+        hot_posts = hot_future.result().get("posts", [])
+        new_posts = new_future.result().get("posts", [])
 
         filtered_count = 0
         if self.feed_filter:
@@ -76,10 +138,10 @@ class Session:
             new_posts = new_result["keep"]
 
         if self.feed_cursor:
-            unseen_hot = self.feed_cursor.unseen(hot_posts, source="hot")
-            unseen_new = self.feed_cursor.unseen(new_posts, source="new")
-            self.feed_cursor.mark_seen(hot_posts, source="hot")
-            self.feed_cursor.mark_seen(new_posts, source="new")
+            # One pass per feed and a single state write for both
+            with self.feed_cursor:
+                unseen_hot = self.feed_cursor.consume(hot_posts, source="hot")
+                unseen_new = self.feed_cursor.consume(new_posts, source="new")
         else:
             unseen_hot = hot_posts
             unseen_new = new_posts
@@ -94,25 +156,44 @@ class Session:
         brief["filtered_count"] = filtered_count
         brief["killed_count"] = killed_count
 
-        if self.tracker:
-            brief["replies"] = self.tracker.check_replies()
-        else:
-            brief["replies"] = []
+        brief["replies"] = replies_future.result() if replies_future else []
 
         if self.partner_monitor:
-            all_feed = hot_posts + new_posts
+            # Posts often appear in both feeds; the monitor needs each once
+            hot_ids = {p.get("id") for p in hot_posts}
+            all_feed = hot_posts + [p for p in new_posts if p.get("id") not in hot_ids]
             brief["partner_activity"] = self.partner_monitor.check(feed_posts=all_feed)
         else:
             brief["partner_activity"] = []
 
+        if prefetch:
+            self._prefetch([p.get("id") for p in unseen_hot + unseen_new][:prefetch])
+
         return brief
 
+    def _prefetch(self, post_ids):
+        """Start fetching posts in the background for read_post()."""
+        pool = self._executor()
+        now = time.monotonic()
+        # Drop prefetches that were never read and are too old to use
+        for post_id, (fetched, future) in list(self._prefetched.items()):
+            if now - fetched >= FEED_CACHE_TTL:
+                future.cancel()
+                del self._prefetched[post_id]
+        for post_id in post_ids:
+            if post_id is not None and post_id not in self._prefetched:
+                self._prefetched[post_id] = (
+                    now,
+                    pool.submit(self.client.post, post_id),
+                )
+
     def catch_up(self, source=None):
         """Mark all current feed content as seen. Fetches feeds and records IDs."""
         if not self.feed_cursor:
             return
-        hot_posts = self.client.feed(sort="hot", limit=25).get("posts", [])
-        new_posts = self.client.feed(sort="new", limit=25).get("posts", [])
+        hot_raw, new_raw = self._executor().map(self._feed, ("hot", "new"), (25, 25))
+        hot_posts = hot_raw.get("posts", [])
+        new_posts = new_raw.get("posts", [])
         self.feed_cursor.catch_up(source="hot", posts=hot_posts)
         self.feed_cursor.catch_up(source="new", posts=new_posts)
 
@@ -122,12 +203,26 @@ class Session:
         Returns a dict with the post content and a flat comment list
         with normalized author names — less nesting, fewer tokens.
         """
-        data = self.client.post(post_id)
+        data = None
+        hit = self._prefetched.pop(post_id, None)
+        # A prefetch older than FEED_CACHE_TTL is as stale as a cached feed
+        future = None
+        if hit is not None:
+            if time.monotonic() - hit[0] < FEED_CACHE_TTL:
+                future = hit[1]
+            else:
+                hit[1].cancel()
+        if future is not None:
+            try:
+                data = future.result()
+            except Exception:
+                pass  # refetch below so the caller sees a fresh error
+        if data is None:
+            data = self.client.post(post_id)
         post = data.get("post", data) if isinstance(data, dict) else data
-        if isinstance(post, dict):
-            comments = data.get("comments", post.get("comments", []))
-        else:
-            comments = data.get("comments", []) if isinstance(data, dict) else []
+        comments = data.get("comments") if isinstance(data, dict) else None
+        if comments is None:
+            comments = post.get("comments", []) if isinstance(post, dict) else []
 
         return {
             "id": post.get("id") if isinstance(post, dict) else None,
@@ -147,6 +242,11 @@ class Session:
         Returns the API response.
         """
         result = self.client.comment(post_id, content, parent_id=parent_id)
+        self._feed_cache.clear()
+        # A prefetched copy predates our comment
+        hit = self._prefetched.pop(post_id, None)
+        if hit is not None:
+            hit[1].cancel()
         if self.tracker:
             comment_id = None
             if isinstance(result, dict):
@@ -156,6 +256,17 @@ class Session:
             self.tracker.watch(post_id, my_comment_id=comment_id)
         return result
 
+    def _my_name(self):
+        """Our agent name from client.me(); cached once known."""
+        if self._agent_name is None:
+            me = self.client.me()
+            agent = me.get("agent", me) if isinstance(me, dict) else me
+            name = agent.get("name", "") if isinstance(agent, dict) else ""
+            if not name:
+                return ""
+            self._agent_name = name
+        return self._agent_name
+
     def my_recent_posts(self, limit=10):
         """Fetch your recent posts as summarized dicts.
 
@@ -163,9 +274,7 @@ class Session:
         Useful for checking what you've posted recently without
         burning tokens on full post objects.
         """
-        me = self.client.me()
-        agent = me.get("agent", me) if isinstance(me, dict) else me
-        name = agent.get("name", "") if isinstance(agent, dict) else ""
+        name = self._my_name()
         if not name:
             return []
 
@@ -1,8 +1,23 @@
 # ABOUTME: Conversation tracker for Moltbook agents.
 # ABOUTME: Persists state between sessions to detect new replies.
 
+import concurrent.futures
+
 from moltbook.helpers import resolve_state_path, load_json, save_json
 
+MAX_WORKERS = 8
+
+
+def _walk_comments(comments):
+    """Yield every comment in a tree, depth-first, without recursion."""
+    stack = list(reversed(comments))
+    while stack:
+        c = stack.pop()
+        yield c
+        replies = c.get("replies")
+        if replies:
+            stack.extend(reversed(replies))
+
 
 class ConversationTracker:
     """Tracks posts you've interacted with and finds new replies.
@@ -19,6 +34,11 @@ class ConversationTracker:
         tracker = ConversationTracker(client)
         tracker.watch("post-uuid", my_comment_id="comment-uuid")
         new = tracker.check_replies()
+
+        # Batch many updates into a single write
+        with tracker:
+            for post_id in post_ids:
+                tracker.watch(post_id)
     """
 
     def __init__(self, client, state_path=None):
@@ -27,9 +47,35 @@ class ConversationTracker:
             state_path = resolve_state_path("tracker.json")
         self.state_path = state_path
         self._state = load_json(state_path, default=lambda: {"watched": {}})
+        # post_id -> (seen_comment_ids list, set of it), reused while the
+        # entry still holds that same list
+        self._seen_sets = {}
+        # Inside a `with tracker:` block saves are deferred until exit
+        self._batch_depth = 0
+        self._dirty = False
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
 
     def _save(self):
-        save_json(self.state_path, self._state)
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            save_json(self.state_path, self._state, compact=True)
+            self._dirty = False
+
+    def flush(self):
+        """Write any changes deferred by a batch."""
+        if self._dirty:
+            save_json(self.state_path, self._state, compact=True)
+            self._dirty = False
 
     @property
     def watched(self):
@@ -56,29 +102,54 @@ class ConversationTracker:
     def unwatch(self, post_id):
         """Stop watching a post."""
         self._state["watched"].pop(post_id, None)
+        self._seen_sets.pop(post_id, None)
         self._save()
 
+    def _seen_set(self, post_id, entry):
+        """The seen comment IDs of a watched post, as a set."""
+        seen_list = entry.get("seen_comment_ids", [])
+        cached = self._seen_sets.get(post_id)
+        if cached is not None and cached[0] is seen_list:
+            return cached[1]
+        seen = set(seen_list)
+        self._seen_sets[post_id] = (seen_list, seen)
+        return seen
+
     def _collect_comment_ids(self, comments):
-        """Recursively collect all comment IDs from a comment tree."""
-        ids = []
-        for c in comments:
-            ids.append(c.get("id"))
-            replies = c.get("replies", [])
-            if replies:
-                ids.extend(self._collect_comment_ids(replies))
-        return ids
-
-    def _find_new_comments(self, comments, seen_ids, my_comment_ids):
-        """Find comments that are new (not in seen_ids) and not by us."""
-        new = []
-        for c in comments:
+        """Collect all comment IDs from a comment tree."""
+        return [c.get("id") for c in _walk_comments(comments)]
+
+    def _scan_comments(self, comments, seen_ids, my_comment_ids):
+        """Walk a comment tree once for its new comments and all its IDs.
+
+        New comments are those not in seen_ids and not by us.
+        """
+        new_comments = []
+        all_ids = []
+        for c in _walk_comments(comments):
             cid = c.get("id")
+            all_ids.append(cid)
             if cid not in seen_ids and cid not in my_comment_ids:
-                new.append(c)
-            replies = c.get("replies", [])
-            if replies:
-                new.extend(self._find_new_comments(replies, seen_ids, my_comment_ids))
-        return new
+                new_comments.append(c)
+        return new_comments, all_ids
+
+    def _fetch_posts(self, watched):
+        """Fetch the watched posts concurrently, in order.
+
+        A post that fails to load comes back as None.
+        """
+
+        def fetch(item):
+            try:
+                return self.client.post(item[0])
+            except Exception:
+                return None
+
+        if len(watched) <= 1:
+            return [fetch(item) for item in watched]
+        workers = min(MAX_WORKERS, len(watched))
+        with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+            return list(pool.map(fetch, watched))
 
     def check_replies(self):
         """Check all watched posts for new comments.
@@ -89,21 +160,30 @@ class ConversationTracker:
         Updates seen state and saves automatically.
         """
         results = []
-        for post_id, entry in list(self._state["watched"].items()):
-            try:
-                data = self.client.post(post_id)
-            except Exception:
+        changed = False
+        watched = list(self._state["watched"].items())
+        # Forget seen sets of posts dropped from the state behind our back
+        if len(self._seen_sets) > len(watched):
+            self._seen_sets = {
+                pid: cached
+                for pid, cached in self._seen_sets.items()
+                if pid in self._state["watched"]
+            }
+        for (post_id, entry), data in zip(watched, self._fetch_posts(watched)):
+            if data is None:
                 continue
 
             post_data = data.get("post", data) if isinstance(data, dict) else data
-            comments = data.get("comments", [])
-            if isinstance(post_data, dict):
-                comments = data.get("comments", post_data.get("comments", []))
+            comments = data.get("comments")
+            if comments is None:
+                comments = (
+                    post_data.get("comments", []) if isinstance(post_data, dict) else []
+                )
 
-            seen_ids = set(entry.get("seen_comment_ids", []))
+            seen_ids = self._seen_set(post_id, entry)
             my_ids = set(entry.get("my_comment_ids", []))
 
-            new_comments = self._find_new_comments(comments, seen_ids, my_ids)
+            new_comments, all_ids = self._scan_comments(comments, seen_ids, my_ids)
 
             if new_comments:
                 results.append(
@@ -116,11 +196,16 @@ class ConversationTracker:
                     }
                 )
 
-            # Update seen state with all current comment IDs
-            all_ids = self._collect_comment_ids(comments)
-            entry["seen_comment_ids"] = list(set(all_ids) | my_ids)
+            # Seen state is exactly the current tree: IDs that have left it
+            # can't come back as replies, and our own IDs are excluded via
+            # my_comment_ids, so nothing else needs to be carried forward
+            if entry.get("seen_comment_ids") != all_ids:
+                entry["seen_comment_ids"] = all_ids
+                changed = True
 
-        self._save()
+        # An idle poll leaves the state as it was; don't rewrite the file
+        if changed:
+            self._save()
         return results
 
     def mark_all_seen(self, post_id):
@@ -133,5 +218,7 @@ class ConversationTracker:
             return
         comments = data.get("comments", [])
         all_ids = self._collect_comment_ids(comments)
-        self._state["watched"][post_id]["seen_comment_ids"] = all_ids
-        self._save()
+        entry = self._state["watched"][post_id]
+        if entry.get("seen_comment_ids") != all_ids:
+            entry["seen_comment_ids"] = all_ids
+            self._save()
@@ -3,10 +3,11 @@
 
 import json
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from unittest.mock import patch
 
-from moltbook.cli import main
+from moltbook.cli import COMMANDS, LOCAL_COMMANDS, USAGE, _split_flags, main
+from moltbook.client import MoltbookError
 
 
 class TestCLIOutput(unittest.TestCase):
@@ -15,13 +16,16 @@ class TestCLIOutput(unittest.TestCase):
     @patch("moltbook.cli.Moltbook")
     def test_feed_outputs_json(self, mock_cls):
         mock_client = mock_cls.return_value
-        mock_client.feed.return_value = {"posts": [{"id": 1, "title": "Test"}]}
+        mock_client.feed_raw.return_value = json.dumps(
+            {"posts": [{"id": 1, "title": "Test"}]}
+        ).encode()
 
         with patch("sys.stdout", new_callable=StringIO) as mock_out:
             main(["feed"])
 
         result = json.loads(mock_out.getvalue())
         self.assertEqual(result["posts"][0]["title"], "Test")
+        mock_client.feed_raw.assert_called_once_with(sort="hot", limit=25)
 
     @patch("moltbook.cli.Moltbook")
     def test_post_outputs_json(self, mock_cls):
@@ -53,6 +57,16 @@ class TestCLIOutput(unittest.TestCase):
         self.assertIn("Usage:", output)
         self.assertIn("molt", output)
 
+    @patch("moltbook.cli.Moltbook")
+    def test_version_prints_version(self, mock_cls):
+        import moltbook
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_out:
+            main(["--version"])
+
+        self.assertEqual(mock_out.getvalue(), f"molt {moltbook.__version__}\n")
+        mock_cls.assert_not_called()
+
     @patch("moltbook.cli.Moltbook")
     def test_unknown_command_exits_nonzero(self, mock_cls):
         with self.assertRaises(SystemExit) as ctx:
@@ -60,6 +74,87 @@ class TestCLIOutput(unittest.TestCase):
                 main(["bogus"])
         self.assertNotEqual(ctx.exception.code, 0)
 
+    def test_unknown_command_prints_usage_to_stderr(self):
+        with self.assertRaises(SystemExit):
+            with patch("sys.stderr", new_callable=StringIO) as mock_err:
+                main(["bogus"])
+        self.assertEqual(mock_err.getvalue(), f"Unknown command: bogus\n{USAGE}")
+
+    @patch("moltbook.cli.Moltbook")
+    def test_api_error_writes_json_line_to_stderr(self, mock_cls):
+        mock_cls.return_value.status.side_effect = MoltbookError(
+            404, "https://example.com", {"error": "Not found"}
+        )
+        with self.assertRaises(SystemExit) as ctx:
+            with patch("sys.stderr", new_callable=StringIO) as mock_err:
+                main(["status"])
+        self.assertEqual(ctx.exception.code, 1)
+        output = mock_err.getvalue()
+        self.assertTrue(output.endswith("\n"))
+        self.assertEqual(json.loads(output)["code"], 404)
+
+    @patch("moltbook.cli.Moltbook")
+    def test_unexpected_error_writes_json_line_to_stderr(self, mock_cls):
+        mock_cls.return_value.status.side_effect = ValueError("boom")
+        with self.assertRaises(SystemExit) as ctx:
+            with patch("sys.stderr", new_callable=StringIO) as mock_err:
+                main(["status"])
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertEqual(mock_err.getvalue(), '{"error":"boom"}\n')
+
+    @patch("moltbook.cli.Moltbook")
+    def test_keyboard_interrupt_exits_130_silently(self, mock_cls):
+        mock_cls.return_value.status.side_effect = KeyboardInterrupt
+        with self.assertRaises(SystemExit) as ctx:
+            with patch("sys.stderr", new_callable=StringIO) as mock_err:
+                main(["status"])
+        self.assertEqual(ctx.exception.code, 130)
+        self.assertEqual(mock_err.getvalue(), "")
+
+    @patch("moltbook.cli.Moltbook")
+    def test_missing_argument_prints_usage(self, mock_cls):
+        with self.assertRaises(SystemExit) as ctx:
+            with patch("sys.stderr", new_callable=StringIO) as mock_err:
+                main(["reply", "p1", "c1"])
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertEqual(
+            mock_err.getvalue(),
+            "Usage: molt reply <post_id> <parent_comment_id> <content>\n",
+        )
+        mock_cls.return_value.comment.assert_not_called()
+
+    @patch("moltbook.cli.Moltbook")
+    def test_unknown_command_does_not_build_client(self, mock_cls):
+        with self.assertRaises(SystemExit):
+            with patch("sys.stderr", new_callable=StringIO):
+                main(["bogus"])
+        mock_cls.assert_not_called()
+
+    @patch("moltbook.cli._feed_rules")
+    @patch("moltbook.cli.Moltbook")
+    def test_local_command_does_not_build_client(self, mock_cls, mock_rules):
+        mock_rules.return_value.summary.return_value = "No feed rules configured."
+        with patch("sys.stdout", new_callable=StringIO) as mock_out:
+            main(["rules"])
+        self.assertIn("No feed rules", mock_out.getvalue())
+        mock_cls.assert_not_called()
+
+    @patch("moltbook.cli._partner_monitor")
+    @patch("moltbook.cli.Moltbook")
+    def test_partners_outputs_text(self, mock_cls, mock_monitor):
+        mock_monitor.return_value.check.return_value = [
+            {"partner": "bicep", "new_posts": [], "oneline": "[+1|0c|1h] A #1"},
+            {"partner": "Marth", "new_posts": [], "oneline": "[+2|0c|2h] B #2"},
+        ]
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_out:
+            main(["partners"])
+
+        self.assertEqual(
+            mock_out.getvalue(),
+            "\nbicep:\n[+1|0c|1h] A #1\n\nMarth:\n[+2|0c|2h] B #2\n",
+        )
+
     @patch("moltbook.cli.Moltbook")
     def test_scan_outputs_text(self, mock_cls):
         mock_client = mock_cls.return_value
@@ -86,8 +181,8 @@ class TestCLIOutput(unittest.TestCase):
         with self.assertRaises(json.JSONDecodeError):
             json.loads(output)
 
-    @patch("moltbook.cli.Session")
-    @patch("moltbook.cli.ConversationTracker")
+    @patch("moltbook.session.Session")
+    @patch("moltbook.tracker.ConversationTracker")
     @patch("moltbook.cli.Moltbook")
     def test_brief_outputs_json(self, mock_cls, mock_tracker_cls, mock_session_cls):
         mock_session = mock_session_cls.return_value
@@ -103,7 +198,7 @@ class TestCLIOutput(unittest.TestCase):
         result = json.loads(mock_out.getvalue())
         self.assertIn("feed_hot", result)
 
-    @patch("moltbook.cli.ConversationTracker")
+    @patch("moltbook.tracker.ConversationTracker")
     @patch("moltbook.cli.Moltbook")
     def test_watch_outputs_json(self, mock_cls, mock_tracker_cls):
         with patch("sys.stdout", new_callable=StringIO) as mock_out:
@@ -116,5 +211,43 @@ class TestCLIOutput(unittest.TestCase):
         )
 
 
+class TestCLIDispatch(unittest.TestCase):
+    """Test the command dispatch table."""
+
+    def test_local_commands_are_registered(self):
+        self.assertLessEqual(LOCAL_COMMANDS, COMMANDS.keys())
+
+    def test_every_usage_command_has_a_handler(self):
+        commands = USAGE.split("Commands:\n", 1)[1].split("\n\n", 1)[0]
+        for line in commands.splitlines():
+            name = line.split()[0]
+            self.assertIn(name, COMMANDS)
+
+
+class TestBinaryOutput(unittest.TestCase):
+    @patch("moltbook.cli.Moltbook")
+    def test_writes_bytes_to_stdout_buffer(self, mock_cls):
+        mock_cls.return_value.status.return_value = {"status": "claimed"}
+        raw = BytesIO()
+        stdout = TextIOWrapper(raw, encoding="utf-8")
+        with patch("sys.stdout", stdout):
+            print("before")
+            main(["status"])
+        stdout.flush()
+        self.assertEqual(raw.getvalue(), b'before\n{"status":"claimed"}\n')
+
+
+class TestSplitFlags(unittest.TestCase):
+    def test_partitions_flags_and_positionals(self):
+        flags, positional = _split_flags(["42", "--compact", "x"], {"--compact"})
+        self.assertEqual(flags, {"--compact"})
+        self.assertEqual(positional, ["42", "x"])
+
+    def test_no_flags(self):
+        flags, positional = _split_flags(["a", "b"], {"--compact"})
+        self.assertEqual(flags, set())
+        self.assertEqual(positional, ["a", "b"])
+
+
 if __name__ == "__main__":
     unittest.main()
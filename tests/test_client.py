@@ -1,15 +1,26 @@
 # ABOUTME: Tests for the Moltbook API client.
 # ABOUTME: Verifies URL construction, headers, credential loading, and request building.
 
+import email.utils
+import http.client
 import json
 import os
 import unittest
-import urllib.error
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from io import BytesIO
 
-from moltbook.client import Moltbook, MoltbookError, RateLimited, _resolve_api_key
+from moltbook.client import (
+    BASE_DELAY,
+    JITTER,
+    MAX_RETRY_AFTER,
+    Moltbook,
+    MoltbookError,
+    RateLimited,
+    _parse_retry_after,
+    _read_api_key,
+    _resolve_api_key,
+)
 
 
 def _make_client():
@@ -21,6 +32,9 @@ def _make_client():
 class TestCredentialResolution(unittest.TestCase):
     """Test the credential resolution chain."""
 
+    def setUp(self):
+        _read_api_key.cache_clear()
+
     def test_env_var_takes_priority(self):
         with patch.dict(os.environ, {"MOLTBOOK_API_KEY": "env_key_123"}):
             client = Moltbook()
@@ -76,6 +90,23 @@ class TestCredentialResolution(unittest.TestCase):
                     client = Moltbook(credentials_path="/custom/creds.json")
         self.assertEqual(client.api_key, "explicit_key")
 
+    def test_file_key_is_cached(self):
+        creds = json.dumps({"api_key": "explicit_key"})
+        with patch.dict(os.environ, {}, clear=True):
+            with patch.object(Path, "read_text", return_value=creds) as mock_read:
+                _resolve_api_key("/custom/creds.json")
+                key = _resolve_api_key("/custom/creds.json")
+        self.assertEqual(key, "explicit_key")
+        mock_read.assert_called_once()
+
+    def test_env_var_is_checked_before_cache(self):
+        creds = json.dumps({"api_key": "file_key"})
+        with patch.dict(os.environ, {}, clear=True):
+            with patch.object(Path, "read_text", return_value=creds):
+                _resolve_api_key()
+            with patch.dict(os.environ, {"MOLTBOOK_API_KEY": "env_key"}):
+                self.assertEqual(_resolve_api_key(), "env_key")
+
     def test_raises_when_no_credentials_found(self):
         with patch.dict(os.environ, {}, clear=True):
             env = os.environ.copy()
@@ -101,12 +132,20 @@ class TestMoltbookURLs(unittest.TestCase):
         self.assertEqual(headers["Authorization"], "Bearer test_key")
         self.assertEqual(headers["Content-Type"], "application/json")
 
+    def test_headers_are_reused(self):
+        self.assertIs(self.client._headers(), self.client._headers())
+
+    def test_headers_follow_api_key_change(self):
+        self.client._headers()
+        self.client.api_key = "other_key"
+        self.assertEqual(self.client._headers()["Authorization"], "Bearer other_key")
+
     @patch("moltbook.client.Moltbook._request")
     def test_feed_default_params(self, mock_req):
         mock_req.return_value = {"posts": []}
         self.client.feed()
         mock_req.assert_called_once_with(
-            "GET", "/feed", params={"sort": "hot", "limit": 25}
+            "GET", "/feed", params={"sort": "hot", "limit": 25}, conditional=True
         )
 
     @patch("moltbook.client.Moltbook._request")
@@ -114,7 +153,16 @@ class TestMoltbookURLs(unittest.TestCase):
         mock_req.return_value = {"posts": []}
         self.client.feed(sort="new", limit=10)
         mock_req.assert_called_once_with(
-            "GET", "/feed", params={"sort": "new", "limit": 10}
+            "GET", "/feed", params={"sort": "new", "limit": 10}, conditional=True
+        )
+
+    @patch("moltbook.client.Moltbook._request_raw")
+    def test_feed_raw_returns_body_bytes(self, mock_req):
+        mock_req.return_value = b'{"posts": []}'
+        body = self.client.feed_raw(sort="new", limit=10)
+        self.assertEqual(body, b'{"posts": []}')
+        mock_req.assert_called_once_with(
+            "GET", "/feed", params={"sort": "new", "limit": 10}, conditional=True
         )
 
     @patch("moltbook.client.Moltbook._request")
@@ -125,6 +173,7 @@ class TestMoltbookURLs(unittest.TestCase):
             "GET",
             "/submolts/general/posts",
             params={"sort": "hot", "limit": 25, "offset": 0},
+            conditional=True,
         )
 
     @patch("moltbook.client.Moltbook._request")
@@ -304,149 +353,132 @@ class TestMoltbookRetry(unittest.TestCase):
     def setUp(self):
         self.client = _make_client()
 
-    def _make_429_error(self, retry_after=None):
+    def _response(self, status, body=b"", headers=None):
+        return status, headers or {}, body
+
+    def _make_429(self, retry_after=None):
         headers = {}
         if retry_after is not None:
             headers["Retry-After"] = str(retry_after)
-        resp = MagicMock()
-        resp.code = 429
-        resp.headers = headers
-        return urllib.error.HTTPError(
-            "https://example.com",
-            429,
-            "Too Many Requests",
-            resp.headers,
-            BytesIO(b""),
-        )
+        return self._response(429, headers=headers)
+
+    def _ok(self):
+        return self._response(200, json.dumps({"ok": True}).encode())
 
     @patch("moltbook.client.time.sleep")
-    @patch("urllib.request.urlopen")
-    def test_retries_on_429_then_succeeds(self, mock_urlopen, mock_sleep):
-        success_resp = MagicMock()
-        success_resp.read.return_value = json.dumps({"ok": True}).encode()
-        success_resp.__enter__ = lambda s: s
-        success_resp.__exit__ = MagicMock(return_value=False)
-
-        mock_urlopen.side_effect = [self._make_429_error(retry_after=5), success_resp]
+    @patch("moltbook.client.Moltbook._send")
+    def test_retries_on_429_then_succeeds(self, mock_send, mock_sleep):
+        mock_send.side_effect = [self._make_429(retry_after=5), self._ok()]
         result = self.client._request("GET", "/feed")
         self.assertEqual(result, {"ok": True})
         mock_sleep.assert_called_once_with(5)
 
     @patch("moltbook.client.time.sleep")
-    @patch("urllib.request.urlopen")
-    def test_raises_after_max_retries(self, mock_urlopen, mock_sleep):
-        mock_urlopen.side_effect = [
-            self._make_429_error(retry_after=1),
-            self._make_429_error(retry_after=1),
-            self._make_429_error(retry_after=1),
+    @patch("moltbook.client.Moltbook._send")
+    def test_raises_after_max_retries(self, mock_send, mock_sleep):
+        mock_send.side_effect = [
+            self._make_429(retry_after=1),
+            self._make_429(retry_after=1),
+            self._make_429(retry_after=1),
         ]
         with self.assertRaises(MoltbookError):
             self.client._request("GET", "/feed")
         self.assertEqual(mock_sleep.call_count, 2)
 
+    @patch("moltbook.client.random.random", return_value=0.0)
     @patch("moltbook.client.time.sleep")
-    @patch("urllib.request.urlopen")
-    def test_uses_default_delay_when_no_retry_after_header(
-        self, mock_urlopen, mock_sleep
+    @patch("moltbook.client.Moltbook._send")
+    def test_uses_backoff_when_no_retry_after_header(
+        self, mock_send, mock_sleep, mock_random
     ):
-        success_resp = MagicMock()
-        success_resp.read.return_value = json.dumps({"ok": True}).encode()
-        success_resp.__enter__ = lambda s: s
-        success_resp.__exit__ = MagicMock(return_value=False)
+        mock_send.side_effect = [self._make_429(), self._ok()]
+        self.client._request("GET", "/feed")
+        mock_sleep.assert_called_once_with(BASE_DELAY)
 
-        mock_urlopen.side_effect = [self._make_429_error(), success_resp]
+    @patch("moltbook.client.random.random", return_value=0.0)
+    @patch("moltbook.client.time.sleep")
+    @patch("moltbook.client.Moltbook._send")
+    def test_backoff_doubles_per_attempt(self, mock_send, mock_sleep, mock_random):
+        mock_send.side_effect = [self._response(503), self._response(503), self._ok()]
         self.client._request("GET", "/feed")
-        mock_sleep.assert_called_once_with(10)
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(delays, [BASE_DELAY, BASE_DELAY * 2])
 
+    @patch("moltbook.client.random.random", return_value=1.0)
     @patch("moltbook.client.time.sleep")
-    @patch("urllib.request.urlopen")
-    def test_retries_on_500(self, mock_urlopen, mock_sleep):
-        success_resp = MagicMock()
-        success_resp.read.return_value = json.dumps({"ok": True}).encode()
-        success_resp.__enter__ = lambda s: s
-        success_resp.__exit__ = MagicMock(return_value=False)
-
-        mock_urlopen.side_effect = [
-            urllib.error.HTTPError(
-                "https://example.com",
-                500,
-                "Server Error",
-                {},
-                BytesIO(b""),
-            ),
-            success_resp,
-        ]
+    @patch("moltbook.client.Moltbook._send")
+    def test_backoff_jitter_is_bounded(self, mock_send, mock_sleep, mock_random):
+        mock_send.side_effect = [self._response(503), self._ok()]
+        self.client._request("GET", "/feed")
+        mock_sleep.assert_called_once_with(BASE_DELAY * (1 + JITTER))
+
+    @patch("moltbook.client.time.sleep")
+    @patch("moltbook.client.Moltbook._send")
+    def test_retry_after_is_a_floor_not_a_cap(self, mock_send, mock_sleep):
+        mock_send.side_effect = [self._make_429(retry_after=0), self._ok()]
+        self.client._request("GET", "/feed")
+        self.assertGreaterEqual(mock_sleep.call_args.args[0], BASE_DELAY)
+
+    @patch("moltbook.client.random.random", return_value=0.0)
+    @patch("moltbook.client.time.sleep")
+    @patch("moltbook.client.Moltbook._send")
+    def test_invalid_retry_after_falls_back_to_backoff(
+        self, mock_send, mock_sleep, mock_random
+    ):
+        mock_send.side_effect = [self._make_429(retry_after="soon"), self._ok()]
+        self.client._request("GET", "/feed")
+        mock_sleep.assert_called_once_with(BASE_DELAY)
+
+    @patch("moltbook.client.time.sleep")
+    @patch("moltbook.client.Moltbook._send")
+    def test_long_retry_after_raises_rate_limited(self, mock_send, mock_sleep):
+        mock_send.return_value = self._make_429(retry_after=MAX_RETRY_AFTER + 1)
+        with self.assertRaises(RateLimited) as ctx:
+            self.client._request("GET", "/feed")
+        self.assertEqual(ctx.exception.retry_after_seconds, MAX_RETRY_AFTER + 1)
+        mock_sleep.assert_not_called()
+
+    @patch("moltbook.client.time.sleep")
+    @patch("moltbook.client.Moltbook._send")
+    def test_retries_on_500(self, mock_send, mock_sleep):
+        mock_send.side_effect = [self._response(500), self._ok()]
         result = self.client._request("GET", "/feed")
         self.assertEqual(result, {"ok": True})
         self.assertEqual(mock_sleep.call_count, 1)
 
     @patch("moltbook.client.time.sleep")
-    @patch("urllib.request.urlopen")
-    def test_retries_on_502(self, mock_urlopen, mock_sleep):
-        success_resp = MagicMock()
-        success_resp.read.return_value = json.dumps({"ok": True}).encode()
-        success_resp.__enter__ = lambda s: s
-        success_resp.__exit__ = MagicMock(return_value=False)
-
-        mock_urlopen.side_effect = [
-            urllib.error.HTTPError(
-                "https://example.com",
-                502,
-                "Bad Gateway",
-                {},
-                BytesIO(b""),
-            ),
-            success_resp,
-        ]
+    @patch("moltbook.client.Moltbook._send")
+    def test_retries_on_502(self, mock_send, mock_sleep):
+        mock_send.side_effect = [self._response(502), self._ok()]
         result = self.client._request("GET", "/feed")
         self.assertEqual(result, {"ok": True})
 
-    @patch("urllib.request.urlopen")
-    def test_does_not_retry_on_404(self, mock_urlopen):
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "https://example.com",
-            404,
-            "Not Found",
-            {},
-            BytesIO(b'{"error": "Not found"}'),
-        )
+    @patch("moltbook.client.Moltbook._send")
+    def test_does_not_retry_on_404(self, mock_send):
+        mock_send.return_value = self._response(404, b'{"error": "Not found"}')
         with self.assertRaises(MoltbookError) as ctx:
             self.client._request("GET", "/agents/nobody")
         self.assertEqual(ctx.exception.code, 404)
-        self.assertEqual(mock_urlopen.call_count, 1)
-
-    @patch("urllib.request.urlopen")
-    def test_does_not_retry_on_401(self, mock_urlopen):
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "https://example.com",
-            401,
-            "Unauthorized",
-            {},
-            BytesIO(b'{"error": "Invalid API key"}'),
-        )
+        self.assertEqual(mock_send.call_count, 1)
+
+    @patch("moltbook.client.Moltbook._send")
+    def test_does_not_retry_on_401(self, mock_send):
+        mock_send.return_value = self._response(401, b'{"error": "Invalid API key"}')
         with self.assertRaises(MoltbookError) as ctx:
             self.client._request("GET", "/feed")
         self.assertEqual(ctx.exception.code, 401)
-        self.assertEqual(mock_urlopen.call_count, 1)
+        self.assertEqual(mock_send.call_count, 1)
 
     @patch("moltbook.client.time.sleep")
-    @patch("urllib.request.urlopen")
-    def test_retries_on_connection_error(self, mock_urlopen, mock_sleep):
-        success_resp = MagicMock()
-        success_resp.read.return_value = json.dumps({"ok": True}).encode()
-        success_resp.__enter__ = lambda s: s
-        success_resp.__exit__ = MagicMock(return_value=False)
-
-        mock_urlopen.side_effect = [
-            urllib.error.URLError("Connection refused"),
-            success_resp,
-        ]
+    @patch("moltbook.client.Moltbook._send")
+    def test_retries_on_connection_error(self, mock_send, mock_sleep):
+        mock_send.side_effect = [ConnectionRefusedError("refused"), self._ok()]
         result = self.client._request("GET", "/feed")
         self.assertEqual(result, {"ok": True})
         self.assertEqual(mock_sleep.call_count, 1)
 
-    @patch("urllib.request.urlopen")
-    def test_raises_rate_limited_on_post_cooldown(self, mock_urlopen):
+    @patch("moltbook.client.Moltbook._send")
+    def test_raises_rate_limited_on_post_cooldown(self, mock_send):
         body = json.dumps(
             {
                 "success": False,
@@ -454,36 +486,288 @@ class TestMoltbookRetry(unittest.TestCase):
                 "retry_after_minutes": 25,
             }
         ).encode()
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "https://example.com",
-            429,
-            "Too Many Requests",
-            {},
-            BytesIO(body),
-        )
+        mock_send.return_value = self._response(429, body)
         with self.assertRaises(RateLimited) as ctx:
             self.client._request("POST", "/posts")
         self.assertEqual(ctx.exception.retry_after_seconds, 25 * 60)
         self.assertIn("25 minute", str(ctx.exception))
 
-    @patch("urllib.request.urlopen")
-    def test_rate_limited_does_not_retry(self, mock_urlopen):
+    @patch("moltbook.client.Moltbook._send")
+    def test_rate_limited_does_not_retry(self, mock_send):
         body = json.dumps(
             {
                 "success": False,
                 "retry_after_minutes": 30,
             }
         ).encode()
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "https://example.com",
-            429,
-            "Too Many Requests",
-            {},
-            BytesIO(body),
-        )
+        mock_send.return_value = self._response(429, body)
         with self.assertRaises(RateLimited):
             self.client._request("POST", "/posts")
-        self.assertEqual(mock_urlopen.call_count, 1)
+        self.assertEqual(mock_send.call_count, 1)
+
+
+class TestMoltbookConditional(unittest.TestCase):
+    """Test ETag revalidation of polled endpoints."""
+
+    def setUp(self):
+        self.client = _make_client()
+
+    @patch("moltbook.client.Moltbook._send")
+    def test_not_modified_returns_stored_body(self, mock_send):
+        mock_send.side_effect = [
+            (200, {"ETag": '"v1"'}, b'{"posts": [1]}'),
+            (304, {}, b""),
+        ]
+        self.assertEqual(self.client.feed(), {"posts": [1]})
+        self.assertEqual(self.client.feed(), {"posts": [1]})
+        self.assertIsNone(mock_send.call_args_list[0].args[3])
+        self.assertEqual(mock_send.call_args.args[3], {"If-None-Match": '"v1"'})
+
+    @patch("moltbook.client.Moltbook._send")
+    def test_new_body_replaces_stored_etag(self, mock_send):
+        mock_send.side_effect = [
+            (200, {"ETag": '"v1"'}, b'{"posts": [1]}'),
+            (200, {"ETag": '"v2"'}, b'{"posts": [2]}'),
+            (304, {}, b""),
+        ]
+        self.client.feed_raw()
+        self.client.feed_raw()
+        self.assertEqual(self.client.feed_raw(), b'{"posts": [2]}')
+        self.assertEqual(mock_send.call_args.args[3], {"If-None-Match": '"v2"'})
+
+    @patch("moltbook.client.Moltbook._send")
+    def test_etag_is_per_url(self, mock_send):
+        mock_send.return_value = (200, {"ETag": '"v1"'}, b"{}")
+        self.client.feed(sort="hot")
+        self.client.feed(sort="new")
+        self.assertIsNone(mock_send.call_args.args[3])
+
+    @patch("moltbook.client.Moltbook._send")
+    def test_other_endpoints_are_unconditional(self, mock_send):
+        mock_send.return_value = (200, {"ETag": '"v1"'}, b"{}")
+        self.client.post("42")
+        self.client.post("42")
+        self.assertIsNone(mock_send.call_args.args[3])
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(_parse_retry_after("7"), 7.0)
+        self.assertEqual(_parse_retry_after(" 0 "), 0.0)
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=90)
+        delay = _parse_retry_after(email.utils.format_datetime(when, usegmt=True))
+        self.assertTrue(85 <= delay <= 90, delay)
+
+    def test_past_date_is_zero(self):
+        self.assertEqual(_parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("soon"))
+
+
+class TestMoltbookConnection(unittest.TestCase):
+    """Test connection reuse in the HTTP transport."""
+
+    def setUp(self):
+        self.client = _make_client()
+        patcher = patch("moltbook.client.urllib.request.getproxies", return_value={})
+        self.mock_proxies = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fake_response(self, body=b"{}", status=200, headers=None):
+        resp = MagicMock()
+        resp.status = status
+        resp.headers = headers or {}
+        resp.read.return_value = body
+        return resp
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_reuses_connection_across_requests(self, mock_conn_cls):
+        conn = mock_conn_cls.return_value
+        conn.getresponse.return_value = self._fake_response()
+        self.client._request("GET", "/feed")
+        self.client._request("GET", "/me")
+        mock_conn_cls.assert_called_once_with("www.moltbook.com", timeout=30)
+        self.assertEqual(conn.request.call_count, 2)
+        target = conn.request.call_args_list[0].args[1]
+        self.assertEqual(target, "/api/v1/feed")
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_reopens_stale_kept_alive_connection(self, mock_conn_cls):
+        stale = MagicMock()
+        stale.getresponse.side_effect = [
+            self._fake_response(),
+            http.client.RemoteDisconnected("closed"),
+        ]
+        fresh = MagicMock()
+        fresh.getresponse.return_value = self._fake_response(b'{"ok": true}')
+        mock_conn_cls.side_effect = [stale, fresh]
+        self.client._request("GET", "/feed")
+        result = self.client._request("GET", "/feed")
+        self.assertEqual(result, {"ok": True})
+        stale.close.assert_called_once()
+        self.assertEqual(mock_conn_cls.call_count, 2)
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_post_is_not_resent_after_stale_response(self, mock_conn_cls):
+        stale = MagicMock()
+        stale.getresponse.side_effect = [
+            self._fake_response(),
+            http.client.RemoteDisconnected("closed"),
+        ]
+        mock_conn_cls.side_effect = [stale, MagicMock()]
+        self.client._send("GET", self.client.base_url + "/feed", None)
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.client._send("POST", self.client.base_url + "/posts/p1/comments", b"{}")
+        self.assertEqual(stale.request.call_count, 2)
+        self.assertEqual(mock_conn_cls.call_count, 1)
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_post_is_resent_when_send_failed(self, mock_conn_cls):
+        stale = MagicMock()
+        stale.getresponse.return_value = self._fake_response()
+        stale.request.side_effect = [None, BrokenPipeError()]
+        fresh = MagicMock()
+        fresh.getresponse.return_value = self._fake_response(b'{"ok": true}')
+        mock_conn_cls.side_effect = [stale, fresh]
+        self.client._send("GET", self.client.base_url + "/feed", None)
+        status, _, body = self.client._send(
+            "POST", self.client.base_url + "/posts/p1/comments", b"{}"
+        )
+        self.assertEqual(body, b'{"ok": true}')
+        fresh.request.assert_called_once()
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_follows_redirect(self, mock_conn_cls):
+        conn = mock_conn_cls.return_value
+        conn.getresponse.side_effect = [
+            self._fake_response(b"", 301, {"Location": "/api/v1/feed2"}),
+            self._fake_response(b'{"ok": true}'),
+        ]
+        self.assertEqual(self.client._request("GET", "/feed"), {"ok": True})
+        self.assertEqual(conn.request.call_args.args[1], "/api/v1/feed2")
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_tunnels_through_https_proxy(self, mock_conn_cls):
+        self.mock_proxies.return_value = {"https": "http://user:pw@proxy:3128"}
+        conn = mock_conn_cls.return_value
+        conn.getresponse.return_value = self._fake_response()
+        self.client._request("GET", "/feed")
+        mock_conn_cls.assert_called_once_with("proxy:3128", timeout=30)
+        conn.set_tunnel.assert_called_once_with(
+            "www.moltbook.com", headers={"Proxy-Authorization": "Basic dXNlcjpwdw=="}
+        )
+
+    @patch("moltbook.client.http.client.HTTPSConnection")
+    def test_close_reaches_worker_thread_connections(self, mock_conn_cls):
+        conns = []
+
+        def new_conn(*args, **kwargs):
+            conn = MagicMock()
+            conn.getresponse.return_value = self._fake_response()
+            conns.append(conn)
+            return conn
+
+        mock_conn_cls.side_effect = new_conn
+        with self.client:
+            self.client.gather(
+                [lambda: self.client._request("GET", "/feed")] * 2, max_workers=2
+            )
+        self.assertTrue(conns)
+        for conn in conns:
+            conn.close.assert_called()
+
+
+class TestMoltbookCache(unittest.TestCase):
+    """Test the TTL cache on read-mostly endpoints."""
+
+    def setUp(self):
+        self.client = _make_client()
+
+    @patch("moltbook.client.Moltbook._request")
+    def test_repeat_reads_hit_cache(self, mock_req):
+        mock_req.return_value = {"agent": {"name": "me"}}
+        self.client.me()
+        self.client.me()
+        self.client.profile("alice")
+        self.client.profile("alice")
+        self.assertEqual(mock_req.call_count, 2)
+
+    @patch("moltbook.client.time.monotonic")
+    @patch("moltbook.client.Moltbook._request")
+    def test_entries_expire(self, mock_req, mock_time):
+        mock_req.return_value = {}
+        mock_time.return_value = 1000.0
+        self.client.submolts()
+        mock_time.return_value = 1000.0 + self.client.cache_ttl
+        self.client.submolts()
+        self.assertEqual(mock_req.call_count, 2)
+
+    @patch("moltbook.client.Moltbook._send")
+    def test_write_clears_cache(self, mock_send):
+        mock_send.return_value = (200, {}, b"{}")
+        self.client.me()
+        self.client.update_profile("new bio")
+        self.client.me()
+        self.assertEqual(mock_send.call_count, 3)
+
+    @patch("moltbook.client.Moltbook._request")
+    def test_cache_clear(self, mock_req):
+        mock_req.return_value = {}
+        self.client.status()
+        self.client.cache_clear()
+        self.client.status()
+        self.assertEqual(mock_req.call_count, 2)
+
+    @patch("moltbook.client.Moltbook._request")
+    def test_errors_are_not_cached(self, mock_req):
+        mock_req.side_effect = [MoltbookError(404, "url"), {"ok": True}]
+        with self.assertRaises(MoltbookError):
+            self.client.profile("ghost")
+        self.assertEqual(self.client.profile("ghost"), {"ok": True})
+
+    def test_ttl_from_environment(self):
+        with patch.dict(os.environ, {"MOLTBOOK_CACHE_TTL": "0"}):
+            client = _make_client()
+        self.assertEqual(client.cache_ttl, 0)
+        with patch.object(client, "_request", return_value={}) as mock_req:
+            client.me()
+            client.me()
+        self.assertEqual(mock_req.call_count, 2)
+
+
+class TestMoltbookGather(unittest.TestCase):
+    """Test concurrent fan-out of independent calls."""
+
+    def setUp(self):
+        self.client = _make_client()
+
+    def test_preserves_call_order(self):
+        calls = [lambda i=i: i * 2 for i in range(10)]
+        self.assertEqual(self.client.gather(calls), [i * 2 for i in range(10)])
+
+    def test_empty(self):
+        self.assertEqual(self.client.gather([]), [])
+
+    def test_propagates_exceptions(self):
+        def boom():
+            raise MoltbookError(404, "url")
+
+        with self.assertRaises(MoltbookError):
+            self.client.gather([lambda: 1, boom])
+
+    @patch("moltbook.client.Moltbook._request")
+    def test_posts_many(self, mock_req):
+        mock_req.side_effect = lambda method, path, **kwargs: {"path": path}
+        results = self.client.posts_many(["a", "b", "c"], sort="new")
+        self.assertEqual(
+            [r["path"] for r in results],
+            ["/submolts/a/posts", "/submolts/b/posts", "/submolts/c/posts"],
+        )
+        self.assertEqual(mock_req.call_args.kwargs["params"]["sort"], "new")
 
 
 if __name__ == "__main__":
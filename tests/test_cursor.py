@@ -1,9 +1,11 @@
 # ABOUTME: Tests for the FeedCursor module.
 # ABOUTME: Verifies mark_seen, unseen filtering, catch_up, and cap enforcement.
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from moltbook.cursor import FeedCursor, _MAX_SEEN_PER_SOURCE
 
@@ -60,6 +62,72 @@ class TestFeedCursorBasic(unittest.TestCase):
         self.assertEqual(len(result), 0)
 
 
+class TestFeedCursorConsume(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        self.tmp.close()
+        self.path = Path(self.tmp.name)
+        self.path.write_text("{}")
+
+    def tearDown(self):
+        self.path.unlink(missing_ok=True)
+
+    def test_consume_returns_unseen_and_marks_seen(self):
+        cursor = FeedCursor(self.path)
+        cursor.mark_seen(_posts(2), source="hot")
+        result = cursor.consume(_posts(4), source="hot")
+        self.assertEqual([p["id"] for p in result], ["3", "4"])
+        self.assertEqual(cursor.unseen(_posts(4), source="hot"), [])
+
+    def test_consume_saves_once(self):
+        cursor = FeedCursor(self.path)
+        with patch.object(cursor, "_save") as mock_save:
+            cursor.consume(_posts(3), source="hot")
+        mock_save.assert_called_once()
+
+
+class TestFeedCursorBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        self.tmp.close()
+        self.path = Path(self.tmp.name)
+        self.path.write_text("{}")
+
+    def tearDown(self):
+        self.path.unlink(missing_ok=True)
+
+    def test_batch_writes_once_on_exit(self):
+        cursor = FeedCursor(self.path)
+        with patch("moltbook.cursor.save_json") as mock_save:
+            with cursor:
+                for post in _posts(5):
+                    cursor.mark_seen([post], source="hot")
+                mock_save.assert_not_called()
+        mock_save.assert_called_once()
+
+    def test_batch_persists_on_exit(self):
+        with FeedCursor(self.path) as cursor:
+            cursor.mark_seen(_posts(3), source="hot")
+        reloaded = FeedCursor(self.path)
+        self.assertEqual(reloaded.unseen(_posts(3), source="hot"), [])
+
+    def test_nested_batches_write_at_outermost_exit(self):
+        cursor = FeedCursor(self.path)
+        with patch("moltbook.cursor.save_json") as mock_save:
+            with cursor:
+                with cursor:
+                    cursor.mark_seen(_posts(1), source="hot")
+                mock_save.assert_not_called()
+        mock_save.assert_called_once()
+
+    def test_clean_batch_does_not_write(self):
+        cursor = FeedCursor(self.path)
+        with patch("moltbook.cursor.save_json") as mock_save:
+            with cursor:
+                cursor.unseen(_posts(3), source="hot")
+        mock_save.assert_not_called()
+
+
 class TestFeedCursorCatchUp(unittest.TestCase):
     def setUp(self):
         self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
@@ -93,6 +161,12 @@ class TestFeedCursorCatchUp(unittest.TestCase):
         result = cursor.unseen(posts, source="hot")
         self.assertEqual(len(result), 0)
 
+    def test_catch_up_with_posts_saves_once(self):
+        cursor = FeedCursor(self.path)
+        with patch.object(cursor, "_save") as mock_save:
+            cursor.catch_up(source="hot", posts=_posts(3))
+        mock_save.assert_called_once()
+
     def test_catch_up_with_posts_no_source(self):
         cursor = FeedCursor(self.path)
         posts = _posts(3)
@@ -159,6 +233,24 @@ class TestFeedCursorCap(unittest.TestCase):
         old_unseen = cursor.unseen(old_posts[:100], source="hot")
         self.assertTrue(len(old_unseen) > 0, "oldest posts should be evicted")
 
+    def test_seen_ids_stay_in_insertion_order(self):
+        cursor = FeedCursor(self.path)
+        cursor.mark_seen(_posts(_MAX_SEEN_PER_SOURCE), source="hot")
+        cursor.mark_seen(_posts(5, start=_MAX_SEEN_PER_SOURCE + 1), source="hot")
+        cursor.mark_seen(_posts(3, start=10), source="hot")  # already seen
+        saved = json.loads(self.path.read_text())["sources"]["hot"]["seen_ids"]
+        expected = [str(i) for i in range(6, _MAX_SEEN_PER_SOURCE + 6)]
+        self.assertEqual(saved, expected)
+
+    def test_evicted_ids_are_unseen_again(self):
+        cursor = FeedCursor(self.path)
+        cursor.mark_seen(_posts(_MAX_SEEN_PER_SOURCE), source="hot")
+        cursor.mark_seen(_posts(10, start=_MAX_SEEN_PER_SOURCE + 1), source="hot")
+        result = cursor.unseen(_posts(20), source="hot")
+        self.assertEqual([p["id"] for p in result], [str(i) for i in range(1, 11)])
+        reloaded = FeedCursor(self.path)
+        self.assertEqual(len(reloaded.unseen(_posts(20), source="hot")), 10)
+
 
 class TestFeedCursorSummary(unittest.TestCase):
     def test_empty_summary(self):
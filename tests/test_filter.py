@@ -0,0 +1,123 @@
+# ABOUTME: Tests for the FeedFilter module.
+# ABOUTME: Verifies blocklist persistence and filtering of posts and comment trees.
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from moltbook.filter import FeedFilter
+
+
+def _comment(cid, author, replies=None):
+    return {"id": cid, "author": {"name": author}, "replies": replies or []}
+
+
+class TestFeedFilterBlocklist(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "blocklist.json"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_block_and_unblock(self):
+        ff = FeedFilter(self.path)
+        ff.block("spammer", reason="spam")
+        self.assertTrue(ff.is_blocked("spammer"))
+        self.assertTrue(ff.is_blocked({"name": "spammer"}))
+        ff.unblock("spammer")
+        self.assertFalse(ff.is_blocked("spammer"))
+        self.assertEqual(ff.stats()["count"], 0)
+
+    def test_blocklist_persists(self):
+        FeedFilter(self.path).block("spammer")
+        self.assertTrue(FeedFilter(self.path).is_blocked("spammer"))
+
+    def test_blocked_returns_a_copy(self):
+        ff = FeedFilter(self.path)
+        ff.blocked.add("someone")
+        self.assertFalse(ff.is_blocked("someone"))
+
+
+class TestFeedFilterEmpty(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.ff = FeedFilter(Path(self.dir.name) / "blocklist.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_filter_posts_returns_new_list(self):
+        posts = [{"id": "1", "author": "alice"}]
+        result = self.ff.filter_posts(posts)
+        self.assertEqual(result, posts)
+        self.assertIsNot(result, posts)
+
+    def test_filter_comments_keeps_tree(self):
+        tree = [_comment("1", "alice", [_comment("2", "bob")])]
+        result = self.ff.filter_comments(tree)
+        self.assertIs(result[0], tree[0])
+
+    def test_filter_post_data_returns_input(self):
+        data = {"comments": [_comment("1", "alice")]}
+        self.assertIs(self.ff.filter_post_data(data), data)
+
+
+class TestFeedFilterFiltering(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.ff = FeedFilter(Path(self.dir.name) / "blocklist.json")
+        self.ff.block("spammer")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_filter_posts(self):
+        posts = [
+            {"id": "1", "author": {"name": "alice"}},
+            {"id": "2", "author": {"name": "spammer"}},
+            {"id": "3", "author": "bob"},
+        ]
+        self.assertEqual([p["id"] for p in self.ff.filter_posts(posts)], ["1", "3"])
+
+    def test_filter_comments_promotes_clean_replies(self):
+        tree = [
+            _comment("1", "spammer", [_comment("2", "alice")]),
+            _comment("3", "bob", [_comment("4", "spammer")]),
+        ]
+        result = self.ff.filter_comments(tree)
+        self.assertEqual([c["id"] for c in result], ["2", "3"])
+        self.assertEqual(result[1]["replies"], [])
+        # The input tree is not modified
+        self.assertEqual(len(tree[1]["replies"]), 1)
+
+    def test_unchanged_comments_are_not_copied(self):
+        tree = [_comment("1", "alice", [_comment("2", "bob")])]
+        self.assertIs(self.ff.filter_comments(tree)[0], tree[0])
+
+    def test_blocked_reply_deep_in_thread(self):
+        leaf = _comment("4", "spammer", [_comment("5", "carol")])
+        tree = [_comment("1", "alice", [_comment("2", "bob", [leaf])])]
+        result = self.ff.filter_comments(tree)
+        self.assertIsNot(result[0], tree[0])
+        self.assertEqual(result[0]["replies"][0]["replies"][0]["id"], "5")
+
+    def test_deep_thread_does_not_recurse(self):
+        tree = [_comment("leaf", "alice")]
+        for i in range(5000):
+            tree = [_comment(str(i), "spammer" if i % 2 else "bob", tree)]
+        result = self.ff.filter_comments(tree)
+        depth = 0
+        while result:
+            depth += 1
+            result = result[0]["replies"]
+        self.assertEqual(depth, 2501)
+
+    def test_filter_post_data(self):
+        data = {"post": {"id": "p"}, "comments": [_comment("1", "spammer")]}
+        self.assertEqual(self.ff.filter_post_data(data)["comments"], [])
+        self.assertEqual(len(data["comments"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,20 @@
 # ABOUTME: Tests for the Moltbook helpers module.
 # ABOUTME: Verifies summarize, filter, and extract functions.
 
+import concurrent.futures
+import os
+import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
 
 from moltbook.helpers import (
+    load_json,
+    resolve_state_path,
+    save_json,
+    _author_name,
+    _submolt_name,
     summarize_post,
     summarize_posts,
     summarize_submolts,
@@ -34,9 +45,9 @@ SAMPLE_POST = {
 }
 
 SAMPLE_POSTS = [
-    {**SAMPLE_POST, "id": "1", "upvotes": 10, "author": {"name": "Eos"}},
-    {**SAMPLE_POST, "id": "2", "upvotes": 2, "author": {"name": "Spotter"}},
-    {**SAMPLE_POST, "id": "3", "upvotes": 0, "author": "Bot", "submolt": "dev"},
+    dict(SAMPLE_POST, id="1", upvotes=10, author={"name": "Eos"}),
+    dict(SAMPLE_POST, id="2", upvotes=2, author={"name": "Spotter"}),
+    dict(SAMPLE_POST, id="3", upvotes=0, author="Bot", submolt="dev"),
 ]
 
 
@@ -67,6 +78,23 @@ class TestSummarizePost(unittest.TestCase):
         self.assertEqual(s["upvotes"], 0)
 
 
+class TestNameNormalization(unittest.TestCase):
+    def test_author_forms(self):
+        from collections import OrderedDict
+
+        self.assertEqual(_author_name({"name": "Eos"}), "Eos")
+        self.assertEqual(_author_name(OrderedDict(name="Eos")), "Eos")
+        self.assertEqual(_author_name("Eos"), "Eos")
+        self.assertEqual(_author_name(""), "unknown")
+        self.assertEqual(_author_name(None), "unknown")
+        self.assertEqual(_author_name({}), "unknown")
+
+    def test_submolt_forms(self):
+        self.assertEqual(_submolt_name({"name": "dev"}), "dev")
+        self.assertEqual(_submolt_name("dev"), "dev")
+        self.assertEqual(_submolt_name(None), "")
+
+
 class TestSummarizePosts(unittest.TestCase):
     def test_summarizes_list(self):
         result = summarize_posts(SAMPLE_POSTS)
@@ -96,6 +124,16 @@ class TestFilterPosts(unittest.TestCase):
         result = filter_posts(SAMPLE_POSTS, min_upvotes=1, authors=["Eos", "Spotter"])
         self.assertEqual(len(result), 2)
 
+    def test_filter_all_criteria_preserves_order(self):
+        posts = [
+            {"id": "a", "upvotes": 5, "author": {"name": "Eos"}, "submolt": "dev"},
+            {"id": "b", "upvotes": 0, "author": "Eos", "submolt": "dev"},
+            {"id": "c", "upvotes": 9, "author": "Eos", "submolt": {"name": "dev"}},
+            {"id": "d", "upvotes": 9, "author": "Other", "submolt": "dev"},
+        ]
+        result = filter_posts(posts, min_upvotes=1, authors=["Eos"], submolts=["dev"])
+        self.assertEqual([p["id"] for p in result], ["a", "c"])
+
     def test_no_filters_returns_all(self):
         result = filter_posts(SAMPLE_POSTS)
         self.assertEqual(len(result), 3)
@@ -151,6 +189,20 @@ class TestExtractComments(unittest.TestCase):
         ids = [c["id"] for c in result]
         self.assertEqual(ids, ["c1", "c2", "c3"])
 
+    def test_deep_thread(self):
+        comments = [{"id": "leaf"}]
+        for i in range(3000):
+            comments = [{"id": str(i), "replies": comments}]
+        flat = extract_comments(comments, flat=True)
+        self.assertEqual(len(flat), 3001)
+        self.assertEqual(flat[-1]["id"], "leaf")
+        nested = extract_comments(comments)
+        depth = 0
+        while nested:
+            depth += 1
+            nested = nested[0].get("replies")
+        self.assertEqual(depth, 3001)
+
     def test_normalizes_author_names(self):
         result = extract_comments(self.COMMENTS, flat=True)
         authors = [c["author"] for c in result]
@@ -177,8 +229,21 @@ class TestDiffFeed(unittest.TestCase):
         self.assertEqual(len(result), 2)
 
     def test_empty_old(self):
-        result = diff_feed([], [{"id": "1"}])
-        self.assertEqual(len(result), 1)
+        new = [{"id": "1"}]
+        result = diff_feed([], new)
+        self.assertEqual(result, new)
+        self.assertIsNot(result, new)
+
+    def test_empty_new(self):
+        self.assertEqual(diff_feed([{"id": "1"}], []), [])
+
+    def test_large_diff(self):
+        # 10k x 10k would take seconds with a list scan per post
+        old = [{"id": str(i)} for i in range(10_000)]
+        new = [{"id": str(i)} for i in range(5_000, 15_000)]
+        result = diff_feed(old, new)
+        self.assertEqual(len(result), 5_000)
+        self.assertEqual(result[0]["id"], "10000")
 
 
 class TestOnelinePost(unittest.TestCase):
@@ -230,6 +295,12 @@ class TestOnelineFeed(unittest.TestCase):
         self.assertIn("#1", lines[0])
         self.assertIn("#2", lines[1])
 
+    def test_reads_clock_once(self):
+        posts = [{"id": str(i), "created_at": "2026-01-31T00:00:00Z"} for i in range(5)]
+        with patch("moltbook.helpers.datetime", wraps=datetime) as mock_dt:
+            oneline_feed(posts)
+        self.assertEqual(mock_dt.now.call_count, 1)
+
     def test_empty_feed(self):
         self.assertEqual(oneline_feed([]), "")
 
@@ -336,33 +407,27 @@ class TestSummarizeProfile(unittest.TestCase):
 
 
 class TestRelativeAge(unittest.TestCase):
-    def test_recent(self):
-        from datetime import datetime, timezone, timedelta
+    # A fixed clock keeps the arithmetic exact regardless of when tests run
+    NOW = datetime(2026, 2, 1, tzinfo=timezone.utc)
 
-        now = datetime.now(timezone.utc)
-        ts = (now - timedelta(hours=2)).isoformat()
+    def test_default_clock(self):
+        ts = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
         self.assertEqual(relative_age(ts), "2h")
 
     def test_days(self):
-        from datetime import datetime, timezone, timedelta
-
-        now = datetime.now(timezone.utc)
-        ts = (now - timedelta(days=3)).isoformat()
-        self.assertEqual(relative_age(ts), "3d")
+        ts = (self.NOW - timedelta(days=3)).isoformat()
+        self.assertEqual(relative_age(ts, self.NOW), "3d")
 
     def test_weeks(self):
-        from datetime import datetime, timezone, timedelta
-
-        now = datetime.now(timezone.utc)
-        ts = (now - timedelta(weeks=2)).isoformat()
-        self.assertEqual(relative_age(ts), "2w")
+        ts = (self.NOW - timedelta(weeks=2)).isoformat()
+        self.assertEqual(relative_age(ts, self.NOW), "2w")
 
     def test_z_suffix(self):
-        from datetime import datetime, timezone, timedelta
+        ts = (self.NOW - timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.assertEqual(relative_age(ts, self.NOW), "30m")
 
-        now = datetime.now(timezone.utc)
-        ts = (now - timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
-        self.assertEqual(relative_age(ts), "30m")
+    def test_explicit_now(self):
+        self.assertEqual(relative_age("2026-01-31T00:00:00Z", self.NOW), "1d")
 
     def test_empty_string(self):
         self.assertEqual(relative_age(""), "?")
@@ -374,5 +439,97 @@ class TestRelativeAge(unittest.TestCase):
         self.assertEqual(relative_age("not-a-date"), "not-a-date")
 
 
+class TestJsonState(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "sub" / "state.json"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_round_trip_creates_parent(self):
+        data = {"name": "caf\u00e9", "ids": [1, 2]}
+        save_json(self.path, data)
+        self.assertEqual(load_json(self.path), data)
+
+    def test_saved_file_is_indented(self):
+        save_json(self.path, {"a": 1})
+        self.assertEqual(self.path.read_text(), '{\n  "a": 1\n}')
+
+    def test_compact_save_has_no_whitespace(self):
+        save_json(self.path, {"a": [1, 2]}, compact=True)
+        self.assertEqual(self.path.read_text(), '{"a":[1,2]}')
+
+    def test_failed_write_keeps_previous_file(self):
+        save_json(self.path, {"a": 1})
+        with patch("moltbook.helpers.os.replace", side_effect=OSError("disk")):
+            with self.assertRaises(OSError):
+                save_json(self.path, {"a": 2})
+        self.assertEqual(load_json(self.path), {"a": 1})
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_save_keeps_existing_mode(self):
+        save_json(self.path, {"a": 1})
+        os.chmod(self.path, 0o600)
+        save_json(self.path, {"a": 2})
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o600)
+
+    def test_concurrent_saves_use_separate_temp_files(self):
+        def save(n):
+            for _ in range(20):
+                save_json(self.path, {"n": n})
+
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            list(pool.map(save, range(4)))
+        self.assertIn(load_json(self.path)["n"], range(4))
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_missing_file_returns_default(self):
+        self.assertEqual(load_json(self.path, default=lambda: {"x": []}), {"x": []})
+
+    def test_undecodable_file_returns_default(self):
+        self.path.parent.mkdir()
+        self.path.write_bytes(b"\xff\xfe\xfa")
+        self.assertEqual(load_json(self.path), {})
+
+
+class TestResolveStatePath(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.cwd = Path(self.dir.name) / "work"
+        self.home = Path(self.dir.name) / "home"
+        self.cwd.mkdir()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _resolve(self, filename):
+        with patch.object(Path, "cwd", return_value=self.cwd), patch.object(
+            Path, "home", return_value=self.home
+        ):
+            return resolve_state_path(filename)
+
+    def test_defaults_to_user_config(self):
+        expected = self.home / ".config" / "moltbook" / "cursor.json"
+        self.assertEqual(self._resolve("cursor.json"), expected)
+
+    def test_prefers_project_dir(self):
+        (self.cwd / "eos").mkdir()
+        self.assertEqual(self._resolve("cursor.json"), self.cwd / "eos" / "cursor.json")
+
+    def test_sees_project_dir_created_later(self):
+        self._resolve("cursor.json")
+        (self.cwd / "eos").mkdir()
+        self.assertEqual(self._resolve("cursor.json"), self.cwd / "eos" / "cursor.json")
+
+    def test_sees_user_file_created_later(self):
+        (self.cwd / "eos").mkdir()
+        self._resolve("cursor.json")
+        user_path = self.home / ".config" / "moltbook" / "cursor.json"
+        user_path.parent.mkdir(parents=True)
+        user_path.write_text("{}")
+        self.assertEqual(self._resolve("cursor.json"), user_path)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,96 @@
+# ABOUTME: Tests for the PartnerMonitor module.
+# ABOUTME: Verifies partner tracking, new-activity detection, and seen state.
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from moltbook.client import MoltbookError
+from moltbook.partners import PartnerMonitor
+
+
+def _post(pid, author):
+    return {"id": pid, "title": f"Post {pid}", "author": {"name": author}}
+
+
+class TestPartnerMonitor(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "partners.json"
+        self.client = MagicMock()
+        self.monitor = PartnerMonitor(self.client, state_path=self.path)
+        self.monitor.add("bicep")
+        self.monitor.add("Marth")
+
+    def tearDown(self):
+        self.monitor.close()
+        self.dir.cleanup()
+
+    def test_check_reports_only_partner_posts(self):
+        feed = [_post("1", "bicep"), _post("2", "other"), _post("3", "Marth")]
+        results = self.monitor.check(feed_posts=feed)
+        by_partner = {r["partner"]: r for r in results}
+        self.assertEqual(set(by_partner), {"bicep", "Marth"})
+        self.assertEqual([p["id"] for p in by_partner["bicep"]["new_posts"]], ["1"])
+        self.client.feed.assert_not_called()
+
+    def test_check_reports_each_post_once(self):
+        feed = [_post("1", "bicep")]
+        self.assertEqual(len(self.monitor.check(feed_posts=feed)), 1)
+        self.assertEqual(self.monitor.check(feed_posts=feed), [])
+        reloaded = PartnerMonitor(self.client, state_path=self.path)
+        self.assertEqual(reloaded.check(feed_posts=feed), [])
+
+    def test_check_fetches_feeds_when_not_given(self):
+        feeds = {"hot": [_post("1", "bicep")], "new": [_post("2", "bicep")]}
+        self.client.feed.side_effect = lambda sort, limit: {"posts": feeds[sort]}
+        results = self.monitor.check()
+        self.assertEqual([p["id"] for p in results[0]["new_posts"]], ["1", "2"])
+
+    def test_feed_pool_is_kept_until_closed(self):
+        self.client.feed.return_value = {"posts": []}
+        self.monitor.check()
+        pool = self.monitor._pool
+        self.monitor.check()
+        self.assertIs(self.monitor._pool, pool)
+        self.monitor.close()
+        self.assertIsNone(self.monitor._pool)
+
+    def test_seen_ids_keep_discovery_order(self):
+        self.monitor.check(feed_posts=[_post("b", "bicep"), _post("a", "bicep")])
+        self.monitor.check(feed_posts=[_post("c", "bicep"), _post("a", "bicep")])
+        saved = json.loads(self.path.read_text())["partners"]["bicep"]
+        self.assertEqual(saved["seen_post_ids"], ["b", "a", "c"])
+
+    def test_check_without_new_activity_does_not_save(self):
+        feed = [_post("1", "bicep"), _post("2", "other")]
+        self.monitor.check(feed_posts=feed)
+        with patch.object(self.monitor, "_save") as mock_save:
+            self.monitor.check(feed_posts=feed)
+            self.monitor.check(feed_posts=[])
+        mock_save.assert_not_called()
+
+    def test_failed_feed_is_skipped(self):
+        def feed(sort, limit):
+            if sort == "hot":
+                raise MoltbookError(500, "url")
+            return {"posts": [_post("2", "bicep")]}
+
+        self.client.feed.side_effect = feed
+        results = self.monitor.check()
+        self.assertEqual([p["id"] for p in results[0]["new_posts"]], ["2"])
+
+    def test_mark_all_seen(self):
+        self.client.feed.return_value = {"posts": [_post("1", "bicep")]}
+        self.monitor.mark_all_seen()
+        self.assertEqual(self.monitor.check(feed_posts=[_post("1", "bicep")]), [])
+
+    def test_remove(self):
+        self.monitor.remove("bicep")
+        self.assertEqual(self.monitor.names, ["Marth"])
+
+
+if __name__ == "__main__":
+    unittest.main()
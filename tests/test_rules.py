@@ -6,8 +6,9 @@ import tempfile
 import unittest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
-from moltbook.rules import FeedRules
+from moltbook.rules import FeedRules, _matcher, _union_matcher
 
 
 def _post(title="Hello", author="alice", submolt="general", pid="1"):
@@ -20,16 +21,23 @@ def _post(title="Hello", author="alice", submolt="general", pid="1"):
     }
 
 
-class TestFeedRulesAddRemove(unittest.TestCase):
+class _RulesFileCase(unittest.TestCase):
+    """One temp directory per class; each test starts from an empty rules file."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._dir.name) / "rules.json"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._dir.cleanup()
+
     def setUp(self):
-        self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        self.tmp.close()
-        self.path = Path(self.tmp.name)
         self.path.write_text("{}")
 
-    def tearDown(self):
-        self.path.unlink(missing_ok=True)
 
+class TestFeedRulesAddRemove(_RulesFileCase):
     def test_add_kill_rule(self):
         rules = FeedRules(self.path)
         rules.add("kill", "title", "spam")
@@ -68,16 +76,7 @@ class TestFeedRulesAddRemove(unittest.TestCase):
             rules.add("kill", "body", "x")
 
 
-class TestFeedRulesMatching(unittest.TestCase):
-    def setUp(self):
-        self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        self.tmp.close()
-        self.path = Path(self.tmp.name)
-        self.path.write_text("{}")
-
-    def tearDown(self):
-        self.path.unlink(missing_ok=True)
-
+class TestFeedRulesMatching(_RulesFileCase):
     def test_substring_match_title(self):
         rules = FeedRules(self.path)
         rules.add("kill", "title", "test post")
@@ -103,6 +102,64 @@ class TestFeedRulesMatching(unittest.TestCase):
         self.assertEqual(len(result["killed"]), 1)
         self.assertEqual(result["killed"][0]["id"], "1")
 
+    def test_invalid_regex_never_matches(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", "/([unclosed/")
+        result = rules.apply([_post(title="([unclosed")])
+        self.assertEqual(len(result["killed"]), 0)
+        self.assertEqual(len(result["keep"]), 1)
+
+    def test_matchers_are_built_once_per_pattern(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", "spam")
+        rules.add("kill", "author", "/^ad/")
+        _matcher.cache_clear()
+        _union_matcher.cache_clear()
+        rules.apply([_post(title="t", pid=str(i)) for i in range(20)])
+        rules.apply([_post(title="t", pid=str(i)) for i in range(20)])
+        self.assertEqual(_matcher.cache_info().misses, 2)
+
+    def test_same_field_rules_share_one_union(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", "Spam")
+        rules.add("kill", "title", "/^buy\\s+now/")
+        rules.add("kill", "title", "a.b")
+        result = rules.apply(
+            [
+                _post(title="this is SPAM", pid="1"),
+                _post(title="Buy   now!", pid="2"),
+                _post(title="a.b literal", pid="3"),
+                _post(title="axb is not a.b-free", pid="4"),
+                _post(title="axb clean", pid="5"),
+            ]
+        )
+        self.assertEqual([p["id"] for p in result["killed"]], ["1", "2", "3", "4"])
+        self.assertEqual([p["id"] for p in result["keep"]], ["5"])
+
+    def test_union_falls_back_for_backreferences_and_flags(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", r"/(\w)\1{3}/")
+        rules.add("kill", "title", "/(?-i:CAPS)/")
+        rules.add("kill", "title", "nothing")
+        result = rules.apply(
+            [
+                _post(title="zzzz", pid="1"),
+                _post(title="CAPS", pid="2"),
+                _post(title="caps", pid="3"),
+            ]
+        )
+        self.assertEqual([p["id"] for p in result["killed"]], ["1", "2"])
+
+    def test_killed_post_skips_remaining_checks(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", "anything")
+        rules.add("kill", "author", "spambot")
+        rules.add("select", "title", "anything")
+        with patch("moltbook.rules._match") as mock_match:
+            result = rules.apply([_post(author="spambot", title="anything")])
+        self.assertEqual(len(result["killed"]), 1)
+        mock_match.assert_not_called()
+
     def test_author_match(self):
         rules = FeedRules(self.path)
         rules.add("kill", "author", "spambot")
@@ -151,16 +208,44 @@ class TestFeedRulesMatching(unittest.TestCase):
         self.assertEqual(len(result["killed"]), 1)
         self.assertEqual(len(result["selected"]), 0)
 
+    def test_author_normalised_once_per_post(self):
+        rules = FeedRules(self.path)
+        for name in ("a", "b", "c", "d"):
+            rules.add("kill", "author", name)
+        with patch("moltbook.rules._author_name", return_value="x") as mock_name:
+            rules.apply([_post(pid="1"), _post(pid="2")])
+        self.assertEqual(mock_name.call_count, 2)
+
+    def test_rule_on_other_field_reads_post(self):
+        rules = [
+            {"action": "kill", "field": "content", "pattern": "buy now"},
+            {"action": "kill", "field": "title", "pattern": "spam"},
+            {
+                "action": "select",
+                "field": "url",
+                "pattern": "example.com",
+                "submolts": ["general"],
+            },
+        ]
+        self.path.write_text(json.dumps({"rules": rules}))
+        posts = [
+            dict(_post(pid="1"), content="Buy now!"),
+            dict(_post(pid="2"), url="https://example.com/x"),
+            _post(pid="3"),
+        ]
+        result = FeedRules(self.path).apply(posts)
+        self.assertEqual([p["id"] for p in result["killed"]], ["1"])
+        self.assertEqual([p["id"] for p in result["selected"]], ["2"])
+        self.assertEqual([p["id"] for p in result["keep"]], ["2", "3"])
 
-class TestFeedRulesPrune(unittest.TestCase):
-    def setUp(self):
-        self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        self.tmp.close()
-        self.path = Path(self.tmp.name)
+    def test_no_rules_keeps_everything(self):
+        posts = [_post(pid="1"), _post(pid="2")]
+        result = FeedRules(self.path).apply(posts)
+        self.assertEqual(result, {"keep": posts, "killed": [], "selected": []})
+        self.assertIsNot(result["keep"], posts)
 
-    def tearDown(self):
-        self.path.unlink(missing_ok=True)
 
+class TestFeedRulesPrune(_RulesFileCase):
     def test_prune_removes_expired(self):
         past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
         future = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
@@ -206,17 +291,33 @@ class TestFeedRulesPrune(unittest.TestCase):
         rules = FeedRules(self.path)
         self.assertEqual(len(rules.rules), 1)
 
+    def test_prune_skips_scan_until_next_expiry(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", "soon", expires_days=1)
+        rules.add("kill", "title", "perm")
+        rules.prune()
+        with patch("moltbook.rules.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime.now(timezone.utc)
+            rules.apply([_post()])
+            mock_dt.fromisoformat.assert_not_called()
+            mock_dt.now.return_value += timedelta(days=2)
+            mock_dt.fromisoformat.side_effect = datetime.fromisoformat
+            rules.prune()
+        self.assertEqual([r["pattern"] for r in rules.rules], ["perm"])
+
+    def test_added_rule_expiry_is_tracked(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "title", "perm")
+        rules.prune()
+        rules.add("kill", "title", "old", expires_days=1)
+        with patch("moltbook.rules.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime.now(timezone.utc) + timedelta(days=2)
+            mock_dt.fromisoformat.side_effect = datetime.fromisoformat
+            rules.prune()
+        self.assertEqual(len(rules.rules), 1)
 
-class TestFeedRulesComments(unittest.TestCase):
-    def setUp(self):
-        self.tmp = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        self.tmp.close()
-        self.path = Path(self.tmp.name)
-        self.path.write_text("{}")
-
-    def tearDown(self):
-        self.path.unlink(missing_ok=True)
 
+class TestFeedRulesComments(_RulesFileCase):
     def test_kill_comments_by_author(self):
         rules = FeedRules(self.path)
         rules.add("kill", "author", "spammer")
@@ -242,6 +343,16 @@ class TestFeedRulesComments(unittest.TestCase):
         self.assertIn("c2", ids)  # promoted
         self.assertIn("c3", ids)
 
+    def test_untouched_subtrees_are_not_copied(self):
+        rules = FeedRules(self.path)
+        rules.add("kill", "author", "spammer")
+        clean = {"id": "c1", "author": "alice", "replies": [{"id": "c2"}]}
+        dirty = {"id": "c3", "author": "bob", "replies": [{"author": "spammer"}]}
+        result = rules.apply_comments([clean, dirty])
+        self.assertIs(result[0], clean)
+        self.assertIsNot(result[1], dirty)
+        self.assertEqual(result[1]["replies"], [])
+
     def test_select_rules_ignored_in_comments(self):
         rules = FeedRules(self.path)
         rules.add("select", "author", "alice")
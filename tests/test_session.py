@@ -4,11 +4,11 @@
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from moltbook.cursor import FeedCursor
 from moltbook.rules import FeedRules
-from moltbook.session import Session
+from moltbook.session import FEED_CACHE_TTL, Session
 
 
 class TestSessionStart(unittest.TestCase):
@@ -59,22 +59,146 @@ class TestSessionStart(unittest.TestCase):
         for call in client.feed.call_args_list:
             self.assertEqual(call.kwargs["limit"], 10)
 
+    def test_start_keeps_feeds_apart_when_fetched_concurrently(self):
+        session, client = self._make_session()
+        client.feed.side_effect = lambda sort, limit: {
+            "posts": [{"id": sort, "title": sort}]
+        }
+        brief = session.start()
+        self.assertEqual([p["id"] for p in brief["feed_hot"]], ["hot"])
+        self.assertEqual([p["id"] for p in brief["feed_new"]], ["new"])
+
+    def test_repeat_start_reuses_feeds(self):
+        session, client = self._make_session()
+        session.start()
+        session.start()
+        self.assertEqual(client.feed.call_count, 2)
+
+    @patch("moltbook.session.time.monotonic")
+    def test_cached_feeds_expire(self, mock_time):
+        session, client = self._make_session()
+        mock_time.return_value = 1000.0
+        session.start()
+        mock_time.return_value = 1000.0 + FEED_CACHE_TTL
+        session.start()
+        self.assertEqual(client.feed.call_count, 4)
+
+    def test_commenting_drops_cached_feeds(self):
+        session, client = self._make_session()
+        session.start()
+        session.comment_and_watch("1", "hi")
+        session.start()
+        self.assertEqual(client.feed.call_count, 4)
+
+    def test_prefetched_post_is_read_without_refetch(self):
+        session, client = self._make_session()
+        client.post.return_value = {"post": {"id": "1", "title": "Hot Post"}}
+        session.start(prefetch=5)
+        self.assertEqual(session.read_post("1")["title"], "Hot Post")
+        client.post.assert_called_once_with("1")
+
+    def test_failed_prefetch_falls_back_to_fetch(self):
+        session, client = self._make_session()
+        client.post.side_effect = [Exception("boom"), {"post": {"id": "1"}}]
+        session.start(prefetch=1)
+        self.assertEqual(session.read_post("1")["id"], "1")
+        self.assertEqual(client.post.call_count, 2)
+
+    def test_commenting_drops_prefetched_post(self):
+        session, client = self._make_session()
+        client.post.return_value = {"post": {"id": "1"}}
+        session.start(prefetch=1)
+        session._prefetched["1"][1].result()
+        session.comment_and_watch("1", "hi")
+        session.read_post("1")
+        self.assertEqual(client.post.call_count, 2)
+
+    @patch("moltbook.session.time.monotonic")
+    def test_stale_prefetch_is_refetched(self, mock_time):
+        session, client = self._make_session()
+        client.post.return_value = {"post": {"id": "1"}}
+        mock_time.return_value = 1000.0
+        session.start(prefetch=1)
+        session._prefetched["1"][1].result()
+        mock_time.return_value = 1000.0 + FEED_CACHE_TTL
+        session.read_post("1")
+        self.assertEqual(client.post.call_count, 2)
+
+    @patch("moltbook.session.time.monotonic")
+    def test_unread_prefetches_are_evicted(self, mock_time):
+        session, client = self._make_session()
+        client.feed.side_effect = lambda sort, limit: {
+            "posts": [{"id": f"{sort}-{mock_time.return_value}"}]
+        }
+        client.post.return_value = {"post": {}}
+        mock_time.return_value = 1000.0
+        session.start(prefetch=2)
+        later = mock_time.return_value = 1000.0 + FEED_CACHE_TTL
+        session.start(prefetch=2)
+        self.assertEqual(sorted(session._prefetched), [f"hot-{later}", f"new-{later}"])
+        session.close()
+
+    def test_start_reuses_one_pool(self):
+        session, _ = self._make_session()
+        session.start()
+        pool = session._pool
+        session.catch_up()
+        session.start(feed_limit=10)
+        self.assertIs(session._pool, pool)
+        session.close()
+
+    def test_close_shuts_down_pool(self):
+        session, client = self._make_session()
+        with session:
+            session.start(prefetch=1)
+            pool = session._pool
+        self.assertIsNone(session._pool)
+        self.assertEqual(session._prefetched, {})
+        with self.assertRaises(RuntimeError):
+            pool.submit(client.post, "1")
+
+    def test_no_prefetch_by_default(self):
+        session, client = self._make_session()
+        session.start()
+        client.post.assert_not_called()
+
+    def test_brief_entries_are_independent(self):
+        session, client = self._make_session()
+        client.feed.side_effect = lambda sort, limit: {
+            "posts": [{"id": "1", "upvotes": 5 if sort == "hot" else 1}]
+        }
+        brief = session.start()
+        self.assertEqual(brief["feed_hot"][0]["upvotes"], 5)
+        self.assertEqual(brief["feed_new"][0]["upvotes"], 1)
+        brief["feed_hot"][0]["note"] = "read"
+        self.assertNotIn("note", brief["unseen_hot"][0])
+        self.assertNotIn("note", brief["feed_new"][0])
+
+    def test_partner_monitor_sees_each_post_once(self):
+        monitor = MagicMock()
+        monitor.check.return_value = []
+        session, client = self._make_session()
+        session.partner_monitor = monitor
+        session.start()
+        feed_posts = monitor.check.call_args.kwargs["feed_posts"]
+        self.assertEqual([p["id"] for p in feed_posts], ["1"])
+
 
 class TestSessionRulesIntegration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.rules_path = Path(cls._dir.name) / "rules.json"
+        cls.cursor_path = Path(cls._dir.name) / "cursor.json"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._dir.cleanup()
+
     def setUp(self):
-        self.tmp_rules = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        self.tmp_rules.close()
-        self.rules_path = Path(self.tmp_rules.name)
         self.rules_path.write_text("{}")
-        self.tmp_cursor = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        self.tmp_cursor.close()
-        self.cursor_path = Path(self.tmp_cursor.name)
         self.cursor_path.write_text("{}")
 
-    def tearDown(self):
-        self.rules_path.unlink(missing_ok=True)
-        self.cursor_path.unlink(missing_ok=True)
-
     def _make_client(self):
         client = MagicMock()
         client.feed.return_value = {
@@ -126,6 +250,13 @@ class TestSessionRulesIntegration(unittest.TestCase):
         brief2 = session2.start()
         self.assertEqual(brief2["unseen_hot_count"], 0)
 
+    def test_cursor_state_written_once_per_start(self):
+        cursor = FeedCursor(self.cursor_path)
+        session = Session(self._make_client(), feed_cursor=cursor)
+        with patch("moltbook.cursor.save_json") as mock_save:
+            session.start()
+        mock_save.assert_called_once()
+
     def test_select_rule_populates_selected(self):
         rules = FeedRules(self.rules_path)
         rules.add("select", "author", "alice")
@@ -242,6 +373,16 @@ class TestSessionMyRecentPosts(unittest.TestCase):
         result = session.my_recent_posts()
         self.assertEqual(result, [])
 
+    def test_agent_name_fetched_once(self):
+        client = MagicMock()
+        client.me.return_value = {"agent": {"name": "Eos"}}
+        client.profile.return_value = {"posts": []}
+        session = Session(client)
+        session.my_recent_posts()
+        session.my_recent_posts()
+        client.me.assert_called_once()
+        self.assertEqual(client.profile.call_count, 2)
+
 
 class TestSessionCommentAndWatch(unittest.TestCase):
     def test_comments_and_watches(self):
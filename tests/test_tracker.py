@@ -1,9 +1,10 @@
 # ABOUTME: Tests for the Moltbook conversation tracker.
 # ABOUTME: Verifies state persistence, watch/unwatch, and reply detection.
 
+import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from moltbook.tracker import ConversationTracker
 
@@ -15,6 +16,7 @@ def _make_tracker(state=None):
     tracker.client = client
     tracker.state_path = Path("/tmp/claude/test_tracker.json")
     tracker._state = state or {"watched": {}}
+    tracker._seen_sets = {}
     tracker._save = MagicMock()
     return tracker, client
 
@@ -155,6 +157,20 @@ class TestCheckReplies(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["new_comments"][0]["id"], "reply-1")
 
+    def test_deep_thread(self):
+        comments = [{"id": "leaf", "replies": []}]
+        for i in range(3000):
+            comments = [{"id": f"c{i}", "replies": comments}]
+        tracker, client = _make_tracker(
+            {"watched": {"p1": {"my_comment_ids": ["c2999"], "seen_comment_ids": []}}}
+        )
+        client.post.return_value = {"post": {"id": "p1"}, "comments": comments}
+        results = tracker.check_replies()
+        new_ids = [c["id"] for c in results[0]["new_comments"]]
+        self.assertEqual(len(new_ids), 3000)
+        self.assertEqual(new_ids[0], "c2998")
+        self.assertEqual(new_ids[-1], "leaf")
+
     def test_updates_seen_ids_after_check(self):
         tracker, client = _make_tracker(
             {
@@ -195,6 +211,111 @@ class TestCheckReplies(unittest.TestCase):
         results = tracker.check_replies()
         self.assertEqual(len(results), 0)
 
+    def test_failed_post_skipped_others_checked_in_order(self):
+        watched = {
+            pid: {"my_comment_ids": [], "seen_comment_ids": []}
+            for pid in ("post-1", "post-2", "post-3")
+        }
+        tracker, client = _make_tracker({"watched": watched})
+
+        def post(post_id):
+            if post_id == "post-2":
+                raise Exception("Network error")
+            return {"post": {"title": post_id}, "comments": [{"id": f"c-{post_id}"}]}
+
+        client.post.side_effect = post
+        results = tracker.check_replies()
+        self.assertEqual([r["post_id"] for r in results], ["post-1", "post-3"])
+        self.assertEqual(watched["post-2"]["seen_comment_ids"], [])
+
+    def test_seen_ids_do_not_accumulate_across_checks(self):
+        tracker, client = _make_tracker(
+            {
+                "watched": {
+                    "post-1": {
+                        "my_comment_ids": ["my-gone"],
+                        "seen_comment_ids": ["deleted-1", "deleted-2"],
+                    }
+                }
+            }
+        )
+        client.post.return_value = {"comments": [{"id": "c1"}, {"id": "c2"}]}
+        tracker.check_replies()
+        self.assertEqual(
+            tracker._state["watched"]["post-1"]["seen_comment_ids"], ["c1", "c2"]
+        )
+
+    def test_idle_poll_does_not_save(self):
+        tracker, client = _make_tracker(
+            {"watched": {"p1": {"my_comment_ids": [], "seen_comment_ids": ["c1"]}}}
+        )
+        client.post.return_value = {"comments": [{"id": "c1"}]}
+        self.assertEqual(tracker.check_replies(), [])
+        tracker._save.assert_not_called()
+
+    def test_seen_set_reused_until_seen_list_changes(self):
+        entry = {"my_comment_ids": [], "seen_comment_ids": ["c1"]}
+        tracker, client = _make_tracker({"watched": {"p1": entry}})
+        first = tracker._seen_set("p1", entry)
+        self.assertIs(tracker._seen_set("p1", entry), first)
+        client.post.return_value = {"comments": [{"id": "c1"}, {"id": "c2"}]}
+        tracker.check_replies()
+        self.assertEqual(tracker._seen_set("p1", entry), {"c1", "c2"})
+
+    def test_seen_sets_dropped_with_their_watch(self):
+        entry = {"my_comment_ids": [], "seen_comment_ids": ["c1"]}
+        tracker, client = _make_tracker({"watched": {"p1": entry, "p2": dict(entry)}})
+        tracker._seen_set("p1", entry)
+        tracker._seen_set("p2", tracker.watched["p2"])
+        tracker.unwatch("p1")
+        self.assertNotIn("p1", tracker._seen_sets)
+        del tracker.watched["p2"]
+        tracker.check_replies()
+        self.assertEqual(tracker._seen_sets, {})
+
+
+class TestScanComments(unittest.TestCase):
+    def test_returns_new_comments_and_all_ids_in_one_walk(self):
+        tracker, _ = _make_tracker()
+        comments = [
+            {"id": "a", "replies": [{"id": "b"}, {"id": "mine"}]},
+            {"id": "c"},
+        ]
+        new, all_ids = tracker._scan_comments(comments, {"a"}, {"mine"})
+        self.assertEqual([c["id"] for c in new], ["b", "c"])
+        self.assertEqual(all_ids, ["a", "b", "mine", "c"])
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "tracker.json"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_batch_writes_once_on_exit(self):
+        tracker = ConversationTracker(MagicMock(), state_path=self.path)
+        with patch("moltbook.tracker.save_json") as mock_save:
+            with tracker:
+                for i in range(5):
+                    tracker.watch(f"post-{i}")
+                mock_save.assert_not_called()
+        mock_save.assert_called_once()
+
+    def test_batch_persists_on_exit(self):
+        with ConversationTracker(MagicMock(), state_path=self.path) as tracker:
+            tracker.watch("post-1", my_comment_id="c1")
+        reloaded = ConversationTracker(MagicMock(), state_path=self.path)
+        self.assertEqual(reloaded.watched["post-1"]["my_comment_ids"], ["c1"])
+
+    def test_clean_batch_does_not_write(self):
+        tracker = ConversationTracker(MagicMock(), state_path=self.path)
+        with patch("moltbook.tracker.save_json") as mock_save:
+            with tracker:
+                tracker.mark_all_seen("not-watched")
+        mock_save.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()